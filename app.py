@@ -1,12 +1,23 @@
 import os
+import json
+import hashlib
+import atexit
+import datetime
 import logging
-from flask import Flask, request, jsonify, render_template
+import threading
+from collections import OrderedDict
+from flask import Flask, Response, request, jsonify, render_template, g, stream_with_context
 import tempfile
 from modules.interview_analyzer.interview_summarize import VideoProcessor
+from modules.interview_analyzer.result_cache import ResultCache
+from modules.interview_analyzer.budget import BudgetExceeded, ResourceBudget
 from modules.job_matching.text_extractor import extract_text_from_file
 from modules.job_matching.matching import ResumeJobMatcher
 from modules.job_matching.job_parser import JobDescriptionParser
 from modules.job_matching.resume_parser import ResumeParser
+from modules.job_matching.dedup import ResumeDeduplicator
+from modules.job_matching.analytics import MatchAnalyticsStore
+from modules.serving.runtime import AdmissionController, AdmissionRejected, StageRunner, StageTimeout
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -17,6 +28,8 @@ VIDEO_FOLDER = os.path.join(UPLOAD_FOLDER, 'videos')
 RESUME_FOLDER = os.path.join(UPLOAD_FOLDER, 'resumes')
 JOB_FOLDER = os.path.join(UPLOAD_FOLDER, 'jobs')
 LOG_FOLDER = os.path.join(os.getcwd(), 'logs')
+CACHE_FOLDER = os.path.join(os.getcwd(), 'cache/interviews')
+ANALYTICS_FOLDER = os.path.join(os.getcwd(), 'analytics/matches')
 os.makedirs(VIDEO_FOLDER, exist_ok=True)
 os.makedirs(RESUME_FOLDER, exist_ok=True)
 os.makedirs(JOB_FOLDER, exist_ok=True)
@@ -35,6 +48,89 @@ logger = logging.getLogger()
 app.config['VIDEO_FOLDER'] = VIDEO_FOLDER
 app.config['RESUME_FOLDER'] = RESUME_FOLDER
 app.config['JOB_FOLDER'] = JOB_FOLDER
+app.config['SKILLS'] = ["Python", "Machine Learning", "SQL", "Deep Learning"]  # Skill vocabulary for matching
+
+# Interview limits, sized for two-hour panel interviews by default and overridable from the environment.
+# A two-hour video is 240 recognizer windows and about 60 chunk summaries on CPU, so the 'interview' stage
+# allows INTERVIEW_TIMEOUT_FACTOR seconds of processing per second of video, and uploads may be as large as
+# a video of that length recorded at INTERVIEW_MAX_MBPS megabits per second.
+MAX_INTERVIEW_MINUTES = float(os.environ.get('MAX_INTERVIEW_MINUTES', 120))
+INTERVIEW_TIMEOUT_FACTOR = float(os.environ.get('INTERVIEW_TIMEOUT_FACTOR', 1.0))
+INTERVIEW_MAX_MBPS = float(os.environ.get('INTERVIEW_MAX_MBPS', 4))
+INTERVIEW_TIMEOUT = MAX_INTERVIEW_MINUTES * 60 * INTERVIEW_TIMEOUT_FACTOR
+app.config['MAX_CONTENT_LENGTH'] = int(MAX_INTERVIEW_MINUTES * 60 * INTERVIEW_MAX_MBPS * 1000 * 1000 / 8)
+
+# Admission control for the analysis endpoints and bounded executors for their stages.
+# Each stage is (max_workers, timeout in seconds).
+# Both interview routes run on the 'interview' stage, so this is the number of videos processed at once.
+INTERVIEW_WORKERS = 1
+ANALYSIS_ENDPOINTS = {'analyze_resume_job', 'analyze_video', 'stream_video_analysis'}
+admission = AdmissionController(max_in_flight=4, max_queued=8, queue_timeout=10.0)
+stage_runner = StageRunner({
+    'extract_text': (4, 30),
+    'parse': (2, 60),
+    'match': (2, 10),
+    'interview': (INTERVIEW_WORKERS, INTERVIEW_TIMEOUT),
+})
+
+# Cache of transcripts, summaries and embeddings keyed by a fingerprint of the uploaded video
+result_cache = ResultCache(CACHE_FOLDER, max_bytes=1024 * 1024 * 1024)
+
+# Caps for processing interviews. The memory cap is on the whole process, which holds every video
+# the 'interview' stage is processing plus the other stages, so it grows with the stage's workers
+INTERVIEW_RSS_PER_VIDEO = 4 * 1024 * 1024 * 1024  # One VideoProcessor's models and audio windows
+BASE_RSS_BYTES = 2 * 1024 * 1024 * 1024  # spaCy, parsed resumes and the other stages
+interview_budget = ResourceBudget(max_rss_bytes=BASE_RSS_BYTES + INTERVIEW_WORKERS * INTERVIEW_RSS_PER_VIDEO,
+                                  max_audio_seconds=30, embed_batch_size=16, summary_batch_size=3)
+
+# Parquet dataset of every match breakdown, written in batches
+match_store = MatchAnalyticsStore(ANALYTICS_FOLDER, batch_size=500)
+atexit.register(match_store.close)
+
+# Near-duplicate resume index, and parsed data keyed by a hash of the exact resume text
+MAX_INDEXED_RESUMES = 10000
+MAX_PARSED_RESUMES = 1000
+resume_deduplicator = ResumeDeduplicator(max_documents=MAX_INDEXED_RESUMES)
+parsed_resumes = OrderedDict()  # text hash -> parsed resume data, least recently used first
+# Resumes are indexed by text hash, since different candidates often upload files with the same name;
+# the filename is kept only to name a duplicate. Holds indexed resumes plus collapsed duplicates.
+resume_names = OrderedDict()  # text hash -> filename it was first uploaded under, least recently used first
+resume_lock = threading.Lock()  # Guards resume_deduplicator, parsed_resumes and resume_names across request threads
+
+@app.before_request
+def admit_request():
+    if request.endpoint in ANALYSIS_ENDPOINTS:
+        admission.acquire()
+        g.admitted = True
+
+@app.teardown_request
+def release_request(exc):
+    if g.pop('admitted', False):
+        admission.release()
+
+def hold_admission_until_done(future):
+    """Keeps the request's admission slot until abandoned stage work finishes."""
+    if g.pop('admitted', False):
+        admission.release_after(future)
+
+def new_video_processor(cancel_event):
+    """Creates a VideoProcessor for one interview; call it on the 'interview' stage so models load there."""
+    return VideoProcessor(cache=result_cache, budget=interview_budget, cancel_event=cancel_event)
+
+def remove_file(path):
+    try:
+        os.remove(path)
+    except PermissionError:
+        logger.warning(f"Could not remove file: {path}. It may be in use.")
+
+@app.errorhandler(AdmissionRejected)
+def handle_admission_rejected(e):
+    logger.warning(f"Request rejected: {e}")
+    response = jsonify({"error": str(e)})
+    response.status_code = e.status_code
+    if e.retry_after is not None:
+        response.headers['Retry-After'] = str(e.retry_after)
+    return response
 
 # Home page route
 @app.route('/')
@@ -76,23 +172,53 @@ def analyze_resume_job():
         logger.info(f"Saved job description to {job_path}")
 
         # Extract text from files
-        resume_text = extract_text_from_file(resume_path)
-        job_text = extract_text_from_file(job_path)
+        resume_text = stage_runner.run('extract_text', extract_text_from_file, resume_path)
+        job_text = stage_runner.run('extract_text', extract_text_from_file, job_path)
 
         logger.debug(f"Extracted resume text: {resume_text[:100]}")  # Log the first 100 characters
         logger.debug(f"Extracted job description text: {job_text[:100]}")  # Log the first 100 characters
 
         # Analyze resume and job description
-        skills = ["Python", "Machine Learning", "SQL", "Deep Learning"]
-        resume_data = ResumeParser(resume_text).summarize(skills)
-        job_data = JobDescriptionParser(job_text).summarize(skills)
+        skills = app.config['SKILLS']
+        # Near-duplicates can differ in skills or contacts, so only identical text reuses parsed data
+        text_hash = hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+        with resume_lock:
+            duplicate_id = resume_deduplicator.add(text_hash, resume_text)
+            duplicate_of = resume_names.get(duplicate_id, "an earlier upload") if duplicate_id is not None else None
+            resume_names.setdefault(text_hash, resume.filename)
+            resume_names.move_to_end(text_hash)
+            while len(resume_names) > 2 * MAX_INDEXED_RESUMES:
+                resume_names.popitem(last=False)
+            resume_data = parsed_resumes.get(text_hash)
+            if resume_data is not None:
+                parsed_resumes.move_to_end(text_hash)
+        if duplicate_id is not None:
+            logger.info(f"Resume {resume.filename} ({text_hash[:12]}) is a near-duplicate of {duplicate_of} "
+                        f"({duplicate_id[:12]})")
+
+        if resume_data is None:
+            resume_data = stage_runner.run('parse', lambda: ResumeParser(resume_text).summarize(skills))
+            with resume_lock:
+                parsed_resumes[text_hash] = resume_data
+                while len(parsed_resumes) > MAX_PARSED_RESUMES:
+                    parsed_resumes.popitem(last=False)
+        job_data = stage_runner.run('parse', lambda: JobDescriptionParser(job_text).summarize(skills))
         logger.info(f"Parsed resume data: {resume_data}")
         logger.info(f"Parsed job data: {job_data}")
 
-        match_score = ResumeJobMatcher(resume_data, job_data).calculate_total_match_score()
+        match_score = stage_runner.run('match', ResumeJobMatcher(resume_data, job_data).calculate_total_match_score)
         logger.info(f"Match score: {match_score}")
+        match_store.append(resume.filename, job_description.filename, resume_data, job_data, match_score)
+
+        return render_template('match_result.html', match_score=match_score, duplicate_of=duplicate_of)
 
-        return render_template('match_result.html', match_score=match_score)
+    except AdmissionRejected:
+        raise
+
+    except StageTimeout as e:
+        logger.error(f"Timeout: {e}")
+        hold_admission_until_done(e.future)
+        return jsonify({"error": str(e)}), 504
 
     except Exception as e:
         logger.error(f"Error occurred: {e}")
@@ -118,23 +244,131 @@ def analyze_video():
             video.save(temp_file.name)
             temp_video = temp_file.name
 
-            # Process the video
-            video_processor = VideoProcessor()
-            response = video_processor.process_video(temp_video)
+            # Process the video on the interview stage, which also loads the models there
+            cancel_event = threading.Event()
+            response = stage_runner.run('interview', lambda: new_video_processor(cancel_event).process_video(temp_video),
+                                        cancel_event=cancel_event)
+
+        logger.info(f"Interview cache stats: {result_cache.stats()}")
 
         # Render results page with analysis
         return render_template('interview_result.html', response=response)
 
+    except AdmissionRejected:
+        raise
+
+    except StageTimeout as e:
+        logger.error(f"Timeout: {e}")
+        # The abandoned run stops at its next audio window; keep its slot and input until then
+        hold_admission_until_done(e.future)
+        e.future.add_done_callback(lambda _, path=temp_video: remove_file(path))
+        temp_video = None
+        return jsonify({"error": str(e)}), 504
+
+    except BudgetExceeded as e:
+        logger.error(f"Resource budget exceeded: {e}")
+        return jsonify({"error": str(e)}), 503
+
     except Exception as e:
         logger.error(f"Error occurred: {e}")
         return jsonify({"error": str(e)}), 500
 
     finally:
         if temp_video:
-            try:
-                os.remove(temp_video)
-            except PermissionError:
-                logger.warning(f"Could not remove file: {temp_video}. It may be in use.")
+            remove_file(temp_video)
+
+
+# Streamed interview analysis route, sending results as server-sent events while they are produced
+@app.route('/interview_analysis_stream', methods=['POST'])
+def stream_video_analysis():
+    if 'video' not in request.files:
+        logger.error("No video file uploaded.")
+        return jsonify({"error": "No video file uploaded."}), 400
+
+    video = request.files['video']
+    if video.filename == '':
+        logger.error("No video file selected.")
+        return jsonify({"error": "No video file selected."}), 400
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(video.filename)[1]) as temp_file:
+        video.save(temp_file.name)
+        temp_video = temp_file.name
+
+    def format_event(event, data):
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    # Run on the interview stage like /interview_analysis, receiving events through a bounded queue
+    cancel_event = threading.Event()
+    try:
+        future, events = stage_runner.stream(
+            'interview', lambda: new_video_processor(cancel_event).stream_video(temp_video), cancel_event=cancel_event
+        )
+    except AdmissionRejected:
+        remove_file(temp_video)
+        raise
+    # The slot and the uploaded video are held until processing stops, even if the client disconnects
+    hold_admission_until_done(future)
+    future.add_done_callback(lambda _: remove_file(temp_video))
+
+    def generate():
+        try:
+            for event, data in events:
+                yield format_event(event, data)
+        except Exception as e:
+            logger.error(f"Error occurred: {e}")
+            yield format_event('error', {"error": str(e)})
+        finally:
+            events.close()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Keep reverse proxies from buffering the stream
+    return response
+
+
+# Interview result cache metrics
+@app.route('/interview_cache_stats')
+def interview_cache_stats():
+    return jsonify(result_cache.stats())
+
+
+def _time_range_args():
+    """Parses optional ISO 8601 'start' and 'end' query parameters."""
+    start = request.args.get('start')
+    end = request.args.get('end')
+    return (datetime.datetime.fromisoformat(start) if start else None,
+            datetime.datetime.fromisoformat(end) if end else None)
+
+# Match analytics routes
+@app.route('/analytics/skill_gaps/<job_id>')
+def analytics_skill_gaps(job_id):
+    try:
+        start, end = _time_range_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(match_store.skill_gap_distribution(job_id, start=start, end=end))
+
+@app.route('/analytics/score_histogram')
+def analytics_score_histogram():
+    try:
+        start, end = _time_range_args()
+        bins = int(request.args.get('bins', 10))
+        if bins < 1:
+            raise ValueError("'bins' must be a positive integer.")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(match_store.score_histogram(request.args.get('job_id'), bins=bins, start=start, end=end))
+
+@app.route('/analytics/top_candidates')
+def analytics_top_candidates():
+    try:
+        start, end = _time_range_args()
+        limit = int(request.args.get('limit', 10))
+        if limit < 1:
+            raise ValueError("'limit' must be a positive integer.")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(match_store.top_candidates(request.args.get('job_id'), limit=limit, start=start, end=end))
 
 
 # Main function to run the app
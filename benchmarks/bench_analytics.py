@@ -0,0 +1,83 @@
+"""
+Measures batched writes and aggregation queries on the match analytics store.
+
+Queries are timed twice: on the layout the app writes (500-row batches, so many small files
+per day) and again after compact(), which serve.py runs daily.
+
+Usage:
+    python -m benchmarks.bench_analytics --rows 1000000 --jobs 50 --days 30
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+from modules.job_matching.analytics import MatchAnalyticsStore
+from modules.job_matching.matching import ResumeJobMatcher
+
+SKILLS = ["Python", "Machine Learning", "SQL", "Deep Learning", "Java", "Docker", "Kubernetes", "Spark"]
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<36} {time.perf_counter() - start:>8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per written batch; the app uses 500.")
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    jobs = [{"skills": generator.sample(SKILLS, 3), "education": ["master's"], "certifications": [],
+             "experience": [], "experience_years": generator.randint(0, 8)} for _ in range(args.jobs)]
+    first_day = datetime.datetime(2024, 1, 1)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = MatchAnalyticsStore(root, batch_size=args.batch_size)
+
+        def write():
+            for i in range(args.rows):
+                job_index = generator.randrange(args.jobs)
+                resume_data = {"skills": generator.sample(SKILLS, generator.randint(0, 5)), "education": [],
+                               "certifications": [], "experience": [], "experience_years": generator.randint(0, 15)}
+                match = ResumeJobMatcher(resume_data, jobs[job_index]).calculate_total_match_score()
+                # Matches arrive in time order, as they do from the app
+                timestamp = first_day + datetime.timedelta(seconds=i * args.days * 86400 // args.rows)
+                store.append(f"resume-{i % (args.rows // 4 + 1)}", f"job-{job_index}", resume_data,
+                             jobs[job_index], match, timestamp)
+            store.flush()
+
+        print(f"{args.rows} rows, {args.jobs} jobs, {args.days} days")
+        elapsed = time.perf_counter()
+        timed("write", write)
+        print(f"{'write throughput':<36} {args.rows / (time.perf_counter() - elapsed):>8.0f} rows/s")
+
+        last_week = first_day + datetime.timedelta(days=args.days - 7)
+
+        def queries():
+            timed("skill gaps, one job", lambda: store.skill_gap_distribution("job-0"))
+            timed("skill gaps, one job, last week", lambda: store.skill_gap_distribution("job-0", start=last_week))
+            timed("score histogram, all jobs", lambda: store.score_histogram())
+            timed("score histogram, one job", lambda: store.score_histogram("job-0"))
+            timed("top candidates, all jobs", lambda: store.top_candidates(limit=10))
+            timed("top candidates, all jobs, last week", lambda: store.top_candidates(limit=10, start=last_week))
+
+        def count_files():
+            return sum(len(files) for _, _, files in os.walk(root))
+
+        print(f"-- as written: {count_files()} files")
+        queries()
+        timed("compact", lambda: store.compact(before=(first_day + datetime.timedelta(days=args.days)).date()))
+        print(f"-- compacted: {count_files()} files")
+        queries()
+
+
+if __name__ == "__main__":
+    main()
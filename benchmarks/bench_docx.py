@@ -0,0 +1,73 @@
+"""
+Compares the streaming DOCX extractor against python-docx on a large generated document.
+
+Each extractor runs in its own process so peak memory (max RSS growth) is measured separately.
+
+Usage:
+    python -m benchmarks.bench_docx --paragraphs 50000 --tables 500
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from docx import Document
+from modules.job_matching.text_extractor import extract_text_from_docx
+
+
+def python_docx_text(path):
+    return '\n'.join(paragraph.text for paragraph in Document(path).paragraphs)
+
+
+EXTRACTORS = {
+    "python-docx": python_docx_text,
+    "streaming": extract_text_from_docx,
+}
+
+
+def make_document(path, paragraphs, tables):
+    document = Document()
+    for i in range(paragraphs):
+        document.add_paragraph(f"Paragraph {i}: led a team shipping Python and SQL services to production.")
+        if tables and i % max(paragraphs // tables, 1) == 0:
+            table = document.add_table(rows=4, cols=3)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = "AWS Certified Solutions Architect"
+    document.save(path)
+
+
+def measure(name, path, results):
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    text = EXTRACTORS[name](path)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss
+    results[name] = (elapsed, peak_rss, len(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    parser.add_argument("--tables", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "large.docx")
+        make_document(path, args.paragraphs, args.tables)
+        print(f"{args.paragraphs} paragraphs, {args.tables} tables, {os.path.getsize(path) / 1024:.0f} KB")
+
+        results = multiprocessing.Manager().dict()
+        for name in EXTRACTORS:
+            process = multiprocessing.Process(target=measure, args=(name, path, results))
+            process.start()
+            process.join()
+
+    print(f"{'extractor':<12} {'seconds':>8} {'peak MB':>8} {'chars':>10}")
+    for name, (elapsed, peak_rss, chars) in results.items():
+        print(f"{name:<12} {elapsed:>8.2f} {peak_rss / 1024:>8.1f} {chars:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares incremental re-scoring against a full recompute of every resume/job pair.
+
+The full recompute rebuilds the skill index and every match component but does not re-run
+spaCy parsing, so the reported speedups are a lower bound.
+
+Usage:
+    python -m benchmarks.bench_incremental --resumes 5000 --jobs 20
+"""
+import argparse
+import random
+import time
+from modules.job_matching.incremental import IncrementalMatcher
+
+VOCABULARY = ["Python", "Machine Learning", "SQL", "Deep Learning", "Java", "Docker", "Kubernetes", "Spark",
+              "Scala", "React", "Go", "Rust", "Terraform", "Airflow", "Tableau", "Excel"]
+FILLER = "designed built maintained led delivered improved services pipelines teams systems customers".split()
+
+
+def make_document(generator, words=300):
+    tokens = [generator.choice(FILLER) for _ in range(words)]
+    for skill in generator.sample(VOCABULARY, generator.randint(1, 6)):
+        tokens.insert(generator.randrange(len(tokens)), skill)
+    data = {
+        "education": [generator.choice(["bachelor's", "master's", "phd"])],
+        "certifications": [],
+        "experience": [f"{generator.randint(0, 12)}+ years of experience"],
+    }
+    return ' '.join(tokens), data
+
+
+def build(skills, resumes, jobs, weights=None):
+    matcher = IncrementalMatcher(skills, weights)
+    for job_id, (text, data) in jobs.items():
+        matcher.add_job(job_id, text, data)
+    matcher.add_resumes((resume_id, text, data) for resume_id, (text, data) in resumes.items())
+    return matcher
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--jobs", type=int, default=20)
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    resumes = {f"resume-{i}": make_document(generator) for i in range(args.resumes)}
+    jobs = {f"job-{i}": make_document(generator, words=150) for i in range(args.jobs)}
+    skills = VOCABULARY[:12]
+    new_weights = {"skill_match": 3, "education_match": 1, "certification_match": 0, "experience_match": 2}
+    edited_job = dict(jobs["job-0"][1], experience=["8+ years of experience"])
+    edited_jobs = dict(jobs, **{"job-0": (jobs["job-0"][0], edited_job)})
+    new_resume = make_document(generator)
+    edited_resume = dict(resumes["resume-0"][1], experience=["12+ years of experience"])
+
+    matcher = build(skills, resumes, jobs)
+    changes = [
+        ("add one skill", lambda: matcher.set_skills(skills + ["Airflow"]),
+         lambda: build(skills + ["Airflow"], resumes, jobs)),
+        ("remove one skill", lambda: matcher.set_skills(skills),
+         lambda: build(skills, resumes, jobs)),
+        ("change weights", lambda: matcher.set_weights(new_weights),
+         lambda: build(skills, resumes, jobs, new_weights)),
+        ("edit one job", lambda: matcher.update_job("job-0", job_data=edited_job),
+         lambda: build(skills, resumes, edited_jobs, new_weights)),
+        ("add one resume", lambda: matcher.add_resume("resume-new", *new_resume),
+         lambda: build(skills, dict(resumes, **{"resume-new": new_resume}), edited_jobs, new_weights)),
+        ("edit one resume", lambda: matcher.update_resume("resume-0", resume_data=edited_resume),
+         lambda: build(skills, dict(resumes, **{"resume-0": (resumes["resume-0"][0], edited_resume)}),
+                       edited_jobs, new_weights)),
+    ]
+
+    print(f"{args.resumes} resumes x {args.jobs} jobs")
+    print(f"{'change':<18} {'full s':>8} {'incremental s':>14} {'speedup':>8}")
+    for name, incremental, full in changes:
+        full_time = timed(full)
+        incremental_time = timed(incremental)
+        print(f"{name:<18} {full_time:>8.3f} {incremental_time:>14.4f} {full_time / incremental_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
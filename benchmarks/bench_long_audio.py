@@ -0,0 +1,64 @@
+"""
+Compares peak memory of reading interview audio whole versus window by window.
+
+Usage:
+    python -m benchmarks.bench_long_audio --minutes 15 30 60 120 --window 30
+"""
+import argparse
+import os
+import tempfile
+import tracemalloc
+import wave
+import speech_recognition as sr
+from modules.interview_analyzer.budget import iter_audio_windows
+
+
+def write_wav(path, seconds, framerate):
+    second = bytes(framerate * 2)
+    with wave.open(path, 'wb') as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(framerate)
+        for _ in range(seconds):
+            audio.writeframes(second)
+
+
+def peak(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def read_whole(path):
+    with sr.AudioFile(path) as source:
+        sr.Recognizer().record(source)
+
+
+def read_windows(path, window):
+    for _ in iter_audio_windows(path, window):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=int, nargs="+", default=[15, 30, 60, 120])
+    parser.add_argument("--window", type=float, default=30)
+    parser.add_argument("--framerate", type=int, default=16000)
+    args = parser.parse_args()
+
+    print(f"{'minutes':>8} {'whole MB':>10} {'windowed MB':>12}")
+    with tempfile.TemporaryDirectory() as root:
+        for minutes in args.minutes:
+            path = os.path.join(root, f"{minutes}.wav")
+            write_wav(path, minutes * 60, args.framerate)
+            whole = peak(lambda: read_whole(path))
+            windowed = peak(lambda: read_windows(path, args.window))
+            print(f"{minutes:>8} {whole:>10.1f} {windowed:>12.1f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures documents per second for the rule engine against the previous per-field regex scans.
+
+Usage:
+    python -m benchmarks.bench_rules --documents 20000
+"""
+import argparse
+import random
+import re
+import time
+from modules.job_matching.rules import DEFAULT_ENGINE
+
+FILLER = "designed built maintained led delivered improved services pipelines teams systems customers".split()
+LINES = [
+    "Email: candidate{i}@example.com",
+    "Phone: (555) 123-{i:04d}",
+    "{years}+ years of experience in Python and SQL.",
+    "Senior Engineer, Acme Corp, Jan {start} - Mar {end}",
+    "Engineer, Foo Inc, {end} to present",
+    "Certifications: AWS Certified Solutions Architect, PMP.",
+]
+
+
+def legacy_extract(text):
+    """The separate scans and string parsing the parsers and matcher did before the rule engine."""
+    certifications = re.findall(
+        r'(certified [\w ]+|\b(?:cisco|aws|pmp|cpa|scrum|google)[\w ]* certification\b)', text, re.IGNORECASE
+    )
+    experience = re.findall(r'\b(\d+\+? years? of experience)\b', text, re.IGNORECASE)
+    emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    phones = re.findall(r'\b\d{10}\b|\(\d{3}\) \d{3}-\d{4}', text)
+    years = 0
+    if experience:
+        try:
+            years = int(experience[0].split('+')[0]) if '+' in experience[0] else int(experience[0].split(' ')[0])
+        except ValueError:
+            years = 0
+    return [cert.strip() for cert in certifications], years, emails, phones
+
+
+def make_document(generator, i, words=400):
+    tokens = [generator.choice(FILLER) for _ in range(words)]
+    start = generator.randint(2000, 2015)
+    lines = [line.format(i=i % 10000, years=generator.randint(1, 15), start=start, end=start + 3) for line in LINES]
+    for line in lines:
+        tokens.insert(generator.randrange(len(tokens)), "\n" + line + "\n")
+    return ' '.join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=10000)
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    documents = [make_document(generator, i) for i in range(args.documents)]
+    megabytes = sum(len(d) for d in documents) / 1e6
+
+    print(f"{args.documents} documents, {megabytes:.1f} MB")
+    print(f"{'extractor':<12} {'seconds':>8} {'docs/s':>9} {'MB/s':>7}")
+    for name, extract in (("legacy", legacy_extract), ("rule engine", DEFAULT_ENGINE.extract)):
+        start = time.perf_counter()
+        for document in documents:
+            extract(document)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<12} {elapsed:>8.2f} {args.documents / elapsed:>9.0f} {megabytes / elapsed:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmarks scatter-gather matching over 1, 2, 4 and 8 shard processes.
+
+Usage:
+    python -m benchmarks.bench_sharding --resumes 100000 --queries 20
+"""
+import argparse
+import random
+import time
+import numpy as np
+from modules.job_matching.sharding import ShardedMatcher
+
+SKILLS = ["Python", "Machine Learning", "SQL", "Deep Learning", "Java", "Docker", "Kubernetes", "Spark"]
+EDUCATION = ["bachelor's", "master's", "phd"]
+
+
+def make_resumes(count, dim, seed=0):
+    generator = random.Random(seed)
+    embeddings = np.random.RandomState(seed).standard_normal((count, dim)).astype(np.float32)
+    for i in range(count):
+        resume_data = {
+            "skills": generator.sample(SKILLS, generator.randint(1, len(SKILLS))),
+            "education": [generator.choice(EDUCATION)],
+            "certifications": [],
+            "experience": [f"{generator.randint(0, 15)}+ years of experience"],
+        }
+        yield f"resume-{i}", resume_data, embeddings[i]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    job_data = {
+        "skills": ["Python", "SQL", "Docker"],
+        "education": ["master's"],
+        "certifications": [],
+        "experience": ["3+ years of experience"],
+    }
+    job_embedding = np.random.RandomState(1).standard_normal(args.dim).astype(np.float32)
+
+    print(f"{args.resumes} resumes, {args.queries} queries, top-{args.top_k}")
+    print(f"{'shards':>6} {'load s':>8} {'query ms':>9} {'queries/s':>10} {'speedup':>8}")
+    baseline = None
+    for num_shards in args.shards:
+        with ShardedMatcher(num_shards=num_shards) as matcher:
+            start = time.perf_counter()
+            matcher.add_resumes(make_resumes(args.resumes, args.dim))
+            load_time = time.perf_counter() - start
+
+            matcher.query(job_data, job_embedding, args.top_k)  # Warm up the embedding matrices
+            start = time.perf_counter()
+            for _ in range(args.queries):
+                matcher.query(job_data, job_embedding, args.top_k)
+            query_time = (time.perf_counter() - start) / args.queries
+
+        baseline = baseline or query_time
+        print(f"{num_shards:>6} {load_time:>8.2f} {query_time * 1000:>9.1f} {1 / query_time:>10.1f} "
+              f"{baseline / query_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
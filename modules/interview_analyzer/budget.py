@@ -0,0 +1,135 @@
+import numpy as np
+import psutil
+import speech_recognition as sr
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, resource, stage, used, limit):
+        """
+        Raised when interview processing goes over one of its resource caps.
+
+        Args:
+            resource (str): The capped resource, e.g. "memory".
+            stage (str): Pipeline stage that was running when the cap was hit.
+            used (str): Human-readable amount in use.
+            limit (str): Human-readable cap.
+        """
+        super().__init__(f"Interview processing exceeded its {resource} budget during {stage}: "
+                         f"{used} in use, limit is {limit}.")
+        self.resource = resource
+        self.stage = stage
+        self.used = used
+        self.limit = limit
+
+
+def _megabytes(num_bytes):
+    return f"{num_bytes / (1024 * 1024):.0f} MB"
+
+
+class ResourceBudget:
+    def __init__(self, max_rss_bytes=None, max_audio_seconds=30, embed_batch_size=16, summary_batch_size=3):
+        """
+        Initializes the ResourceBudget, the caps a VideoProcessor keeps to while processing one video.
+
+        Args:
+            max_rss_bytes (int): Peak resident memory of the process, including loaded models, or None
+                for no cap. The process is shared with every other video being processed, so size it
+                for all of them. Checked after every audio window and model call.
+            max_audio_seconds (float): Seconds of decoded audio held in memory at once; longer
+                transcription windows are shortened to fit.
+            embed_batch_size (int): Transcript chunks sent to the embedder per call.
+            summary_batch_size (int): Chunk summaries combined per summarizer call when reducing them
+                to the final summary.
+        """
+        if max_audio_seconds <= 0:
+            raise ValueError("max_audio_seconds must be positive.")
+        if embed_batch_size < 1 or summary_batch_size < 2:
+            raise ValueError("embed_batch_size must be at least 1 and summary_batch_size at least 2.")
+        self.max_rss_bytes = max_rss_bytes
+        self.max_audio_seconds = max_audio_seconds
+        self.embed_batch_size = embed_batch_size
+        self.summary_batch_size = summary_batch_size
+        self._process = psutil.Process()
+
+    def rss(self):
+        """Returns the resident memory of this process in bytes."""
+        return self._process.memory_info().rss
+
+    def check_memory(self, stage):
+        """
+        Checks the process's resident memory against the cap.
+
+        Args:
+            stage (str): Pipeline stage being run, named in the error.
+
+        Raises:
+            BudgetExceeded: If resident memory is over max_rss_bytes.
+        """
+        if self.max_rss_bytes is None:
+            return
+        rss = self.rss()
+        if rss > self.max_rss_bytes:
+            raise BudgetExceeded("memory", stage, _megabytes(rss), _megabytes(self.max_rss_bytes))
+
+
+def iter_audio_windows(audio_path, window_seconds):
+    """
+    Reads an audio file window by window, so only one window of decoded audio is in memory.
+
+    Unlike Recognizer.record(source, duration=...), no frames are dropped at window boundaries.
+
+    Args:
+        audio_path (str): Path to a WAV, AIFF or FLAC file.
+        window_seconds (float): Length of each window.
+
+    Yields:
+        tuple: (start seconds, end seconds, speech_recognition.AudioData) for each window.
+    """
+    with sr.AudioFile(audio_path) as source:
+        window_frames = max(1, int(window_seconds * source.SAMPLE_RATE))
+        start_frame = 0
+        while True:
+            frame_data = source.stream.read(window_frames)
+            if not frame_data:
+                break
+            end_frame = start_frame + len(frame_data) // source.SAMPLE_WIDTH
+            yield (start_frame / source.SAMPLE_RATE, end_frame / source.SAMPLE_RATE,
+                   sr.AudioData(frame_data, source.SAMPLE_RATE, source.SAMPLE_WIDTH))
+            start_frame = end_frame
+
+
+class PooledEmbedding:
+    def __init__(self, dim):
+        """
+        Initializes the PooledEmbedding, a running weighted mean of chunk embeddings.
+
+        Args:
+            dim (int): Embedding dimension.
+        """
+        self.total = np.zeros(dim, dtype=np.float64)
+        self.weight = 0.0
+
+    def add(self, embeddings, weights):
+        """
+        Adds a batch of chunk embeddings to the pool.
+
+        Args:
+            embeddings (array-like): One embedding per chunk.
+            weights (list): Weight of each chunk, e.g. its word count.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        self.total += weights @ np.asarray(embeddings, dtype=np.float64)
+        self.weight += float(weights.sum())
+
+    def value(self):
+        """
+        Returns the pooled embedding, scaled to unit length like the embedder's own output.
+
+        Returns:
+            numpy.ndarray: The pooled embedding, or None if nothing has been added.
+        """
+        if self.weight == 0:
+            return None
+        mean = self.total / self.weight
+        norm = np.linalg.norm(mean)
+        return (mean / norm if norm else mean).astype(np.float32)
@@ -2,18 +2,69 @@ import os
 import tempfile
 from moviepy import VideoFileClip
 import speech_recognition as sr
+import transformers
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 import numpy as np
 import faiss
+import sentence_transformers
 from sentence_transformers import SentenceTransformer
+from modules.interview_analyzer.budget import PooledEmbedding, ResourceBudget, iter_audio_windows
+from modules.interview_analyzer.result_cache import fingerprint_file
+
+# Model behind each stage; changing one invalidates only the cached results that depend on it.
+# Cache keys also include the library version and the loaded model's revision, and for the chunking
+# stages the chunk sizes in use (see VideoProcessor.revisions).
+MODEL_VERSIONS = {
+    "transcript": "google-speech-recognition",
+    "summary": "facebook/bart-large-cnn",
+    "embedding": "sentence-transformers/all-MiniLM-L6-v2",
+    "pooling": "weighted-mean-of-chunks",
+    "summary_chunking": "chunks-reduced-in-batches",
+}
+
+def _model_revision(model):
+    """Returns the Hugging Face commit a transformers model was loaded from, if known."""
+    return getattr(getattr(model, "config", None), "_commit_hash", None) or "unknown-revision"
+
+
+# Cached summaries depend on the transcript, the summarizer and how the transcript is chunked
+SUMMARY_DEPENDENCIES = ["transcript", "summary", "summary_chunking"]
+
+
+class ProcessingCancelled(Exception):
+    """Raised inside a VideoProcessor once its cancel event is set, e.g. after the caller timed out."""
+
 
 class VideoProcessor:
-    def __init__(self):
-        """Initialize models and FAISS setup."""
+    SEGMENT_SECONDS = 30  # Audio window sent to the recognizer at a time
+    RECOGNIZER_TIMEOUT = 60  # Seconds before a single recognition request is abandoned
+    SUMMARY_CHUNK_WORDS = 350  # Transcript words per chunk summary, within the summarizer's 512 tokens
+    EMBEDDING_CHUNK_WORDS = 150  # Transcript words per pooled chunk embedding, within the embedder's 256 tokens
+
+    def __init__(self, cache=None, budget=None, cancel_event=None):
+        """
+        Initialize models and FAISS setup, optionally with a ResultCache for stage results, a
+        ResourceBudget capping memory, audio in flight and model batch sizes, and a threading.Event
+        that stops processing at the next audio window or model call once it is set.
+        """
         # Load models
-        self.tokenizer = AutoTokenizer.from_pretrained("facebook/bart-large-cnn")
-        self.model = AutoModelForSeq2SeqLM.from_pretrained("facebook/bart-large-cnn")
-        self.embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        self.tokenizer = AutoTokenizer.from_pretrained(MODEL_VERSIONS["summary"])
+        self.model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_VERSIONS["summary"])
+        self.embedder = SentenceTransformer(MODEL_VERSIONS["embedding"])
+        # Library and model revisions, so upgrading either changes the cache key
+        self.revisions = {
+            "transcript": f"SpeechRecognition {sr.__version__}",
+            "summary": f"transformers {transformers.__version__} {_model_revision(self.model)}",
+            "embedding": f"sentence-transformers {sentence_transformers.__version__} "
+                         f"{_model_revision(getattr(self.embedder[0], 'auto_model', None))}",
+        }
+        self.cache = cache
+        self.budget = budget or ResourceBudget()
+        self.cancel_event = cancel_event
+        # Chunk sizes, so changing one of them invalidates the summaries and embeddings built with it
+        self.revisions["pooling"] = f"{self.EMBEDDING_CHUNK_WORDS}-word chunks"
+        self.revisions["summary_chunking"] = (f"{self.SUMMARY_CHUNK_WORDS}-word chunks, "
+                                              f"batches of {self.budget.summary_batch_size}")
 
         # FAISS setup
         self.embedding_dim = 384  # Dimension of embeddings
@@ -28,61 +79,185 @@ class VideoProcessor:
         audio.write_audiofile(audio_path)
         return audio_path
 
+    def transcribe_segments(self, audio_path):
+        """
+        Transcribes audio window by window, yielding each segment with its timestamps as it is recognized.
+        Windows are at most the budget's max_audio_seconds long.
+        """
+        recognizer = sr.Recognizer()
+        recognizer.operation_timeout = self.RECOGNIZER_TIMEOUT
+        window_seconds = min(self.SEGMENT_SECONDS, self.budget.max_audio_seconds)
+        for start, end, audio_data in iter_audio_windows(audio_path, window_seconds):
+            try:
+                text = recognizer.recognize_google(audio_data)
+            except sr.UnknownValueError:
+                text = ""  # No recognizable speech in this window
+            except Exception as e:
+                raise RuntimeError(f"Transcription error: {e}")
+            del audio_data
+            self._checkpoint("transcription")
+            if text:
+                yield {"start": start, "end": end, "text": text}
+
     def transcribe_audio(self, audio_path):
         """Transcribes audio to text."""
-        recognizer = sr.Recognizer()
-        with sr.AudioFile(audio_path) as source:
-            audio_data = recognizer.record(source)
-        try:
-            return recognizer.recognize_google(audio_data)
-        except Exception as e:
-            raise RuntimeError(f"Transcription error: {e}")
+        return " ".join(segment["text"] for segment in self.transcribe_segments(audio_path))
 
     def embed_text(self, text):
         """Generates embeddings for text using a sentence transformer model."""
         return self.embedder.encode([text])[0]
 
+    def embed_chunks(self, texts):
+        """Generates embeddings for a batch of texts."""
+        return self.embedder.encode(texts, batch_size=self.budget.embed_batch_size)
+
+    def embed_transcript(self, transcript):
+        """
+        Embeds the transcript as the word-weighted mean of its chunk embeddings, so the whole transcript
+        is represented rather than only what fits in the embedder's input, one batch at a time.
+        """
+        words = transcript.split()
+        pooled = PooledEmbedding(self.embedding_dim)
+        step = self.EMBEDDING_CHUNK_WORDS
+        batch_words = step * self.budget.embed_batch_size
+        for batch_start in range(0, len(words), batch_words):
+            chunks = [words[i:i + step] for i in range(batch_start, min(batch_start + batch_words, len(words)), step)]
+            pooled.add(self.embed_chunks([" ".join(chunk) for chunk in chunks]), [len(chunk) for chunk in chunks])
+            self._checkpoint("embedding")
+        return pooled.value()
+
     def generate_summary(self, text):
         """Generates a contextual summary using a transformer model."""
         inputs = self.tokenizer.encode("summarize: " + text, return_tensors="pt", truncation=True, max_length=512)
         summary_ids = self.model.generate(
             inputs, max_length=150, min_length=30, length_penalty=2.0, num_beams=4, early_stopping=True
         )
-        return self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+        summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+        self._checkpoint("summarization")
+        return summary
 
-    def process_video(self, video_path):
-        """Processes the video, extracting audio, transcribing, summarizing, and generating embeddings."""
-        # Extract audio
-        audio_path = self.extract_audio(video_path)
+    def combine_summaries(self, summaries):
+        """
+        Reduces chunk summaries to one summary, summarizing at most the budget's summary_batch_size
+        of them per call so every call stays within the summarizer's input.
+        """
+        while len(summaries) > 1:
+            batch_size = self.budget.summary_batch_size
+            summaries = [self.generate_summary(" ".join(summaries[i:i + batch_size]))
+                         for i in range(0, len(summaries), batch_size)]
+        return summaries[0]
+
+    def _checkpoint(self, stage):
+        """Stops processing if it was cancelled or went over its memory budget."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ProcessingCancelled(f"Interview processing was cancelled during {stage}.")
+        self.budget.check_memory(stage)
+
+    def _cache_get(self, stage, fingerprint, depends_on):
+        """Returns a cached stage result, or None if there is no cache or no entry."""
+        if self.cache is None:
+            return None
+        return self.cache.get(stage, fingerprint, self._versions(depends_on))
+
+    def _cache_put(self, stage, fingerprint, depends_on, value):
+        """Stores a stage result if a cache is configured."""
+        if self.cache is not None:
+            self.cache.put(stage, fingerprint, self._versions(depends_on), value)
+
+    def _versions(self, depends_on):
+        """Returns the model versions and revisions a cached stage result depends on."""
+        return {name: [MODEL_VERSIONS[name], self.revisions.get(name)] for name in depends_on}
+
+    def stream_video(self, video_path):
+        """
+        Processes the video stage by stage, yielding (event, data) pairs as results become available.
+
+        Events are "segment" for each transcribed segment, "summary_chunk" as each transcript chunk is
+        summarized, then "summary", "traits" and finally "done" with the same result as process_video().
+        Audio windows and summarized chunks are dropped as soon as they have been emitted.
+        Raises BudgetExceeded as soon as resident memory goes over the budget's cap.
+        """
+        # Look results up by the uploaded file itself, so a cache hit never decodes the video
+        fingerprint = fingerprint_file(video_path) if self.cache is not None else None
+        audio_path = None
 
         try:
-            # Transcribe audio
-            transcript = self.transcribe_audio(audio_path)
+            transcription = self._cache_get("transcript", fingerprint, ["transcript"])
+            summary = self._cache_get("summary", fingerprint, SUMMARY_DEPENDENCIES)
+
+            segments = []
+            chunk_words = []
+            chunk_summaries = []
+            if transcription is not None:
+                segments = transcription["segments"]
+                for segment in segments:
+                    yield "segment", segment
+            else:
+                # Extract audio, then transcribe it, summarizing each chunk of the transcript once it fills up
+                audio_path = self.extract_audio(video_path)
+                for segment in self.transcribe_segments(audio_path):
+                    segments.append(segment)
+                    yield "segment", segment
+                    if summary is None:
+                        chunk_words.extend(segment["text"].split())
+                        if len(chunk_words) >= self.SUMMARY_CHUNK_WORDS:
+                            chunk_summaries.append(self.generate_summary(" ".join(chunk_words)))
+                            chunk_words = []
+                            yield "summary_chunk", {"index": len(chunk_summaries) - 1, "summary": chunk_summaries[-1]}
+                transcription = {"transcript": " ".join(s["text"] for s in segments), "segments": segments}
+                self._cache_put("transcript", fingerprint, ["transcript"], transcription)
 
+            transcript = transcription["transcript"]
             if not transcript:
                 raise ValueError("Could not process the audio.")
 
+            # Generate summary
+            if summary is None:
+                if not chunk_summaries and not chunk_words:
+                    # Transcript came from the cache; summarize it chunk by chunk like a fresh one
+                    words = transcript.split()
+                    step = self.SUMMARY_CHUNK_WORDS
+                    for start in range(0, len(words) - step, step):
+                        chunk_summaries.append(self.generate_summary(" ".join(words[start:start + step])))
+                        yield "summary_chunk", {"index": len(chunk_summaries) - 1, "summary": chunk_summaries[-1]}
+                    chunk_words = words[len(chunk_summaries) * step:]
+                if chunk_words:
+                    chunk_summaries.append(self.generate_summary(" ".join(chunk_words)))
+                    yield "summary_chunk", {"index": len(chunk_summaries) - 1, "summary": chunk_summaries[-1]}
+                summary = self.combine_summaries(chunk_summaries)
+                self._cache_put("summary", fingerprint, SUMMARY_DEPENDENCIES, summary)
+            yield "summary", {"summary": summary}
+
             # Generate embedding and store in FAISS
-            embedding = self.embed_text(transcript)
-            self.faiss_index.add(np.array([embedding]))
+            embedding = self._cache_get("embedding", fingerprint, ["transcript", "embedding", "pooling"])
+            if embedding is None:
+                embedding = self.embed_transcript(transcript).tolist()
+                self._cache_put("embedding", fingerprint, ["transcript", "embedding", "pooling"], embedding)
+            self.faiss_index.add(np.array([embedding], dtype=np.float32))
             self.document_store.append({"filename": video_path, "transcript": transcript})
 
-            # Generate summary
-            summary = self.generate_summary(transcript)
-
             # Key trait analysis (rudimentary example)
             traits = {
                 "Communication Style": "Effective",
                 "Active Listening": "Good",
                 "Engagement": "Moderate",
             }
+            yield "traits", traits
 
-            return {
+            yield "done", {
                 "transcript": transcript,
+                "segments": segments,
                 "summary": summary,
                 "traits": traits
             }
 
         finally:
             # Clean up
-            os.remove(audio_path)
+            if audio_path is not None:
+                os.remove(audio_path)
+
+    def process_video(self, video_path):
+        """Processes the video, extracting audio, transcribing, summarizing, and generating embeddings."""
+        for event, data in self.stream_video(video_path):
+            if event == "done":
+                return data
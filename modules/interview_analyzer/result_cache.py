@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def fingerprint_file(path, chunk_size=1024 * 1024):
+    """
+    Computes a content fingerprint of a file's bytes without decoding it.
+
+    Used to look up results for an uploaded video before any audio is extracted; the
+    same video uploaded under another name has the same fingerprint.
+
+    Args:
+        path (str): Path to the file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        """
+        Initializes the ResultCache, a persistent per-stage store of interview analysis results.
+
+        Entries are JSON files named by a hash of the stage, the media fingerprint and the
+        versions of the models the stage depends on. Least recently used entries are evicted
+        once the cache grows past its disk budget.
+
+        Args:
+            cache_dir (str): Directory to keep cache entries in; created if missing.
+            max_bytes (int): Disk budget for all entries together.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> size in bytes, least recently used first
+        self.total_bytes = 0
+        self.hits = {}
+        self.misses = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        files = [entry for entry in os.scandir(cache_dir) if entry.name.endswith('.json')]
+        for entry in sorted(files, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self.entries[entry.name[:-len('.json')]] = size
+            self.total_bytes += size
+
+    def key(self, stage, fingerprint, versions):
+        """
+        Builds the cache key of a stage result.
+
+        Args:
+            stage (str): Name of the stage, e.g. "transcript".
+            fingerprint (str): Fingerprint of the media.
+            versions (dict): Versions of every model the stage depends on.
+
+        Returns:
+            str: Hex digest identifying the entry.
+        """
+        payload = json.dumps([stage, fingerprint, versions], sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, stage, fingerprint, versions):
+        """
+        Looks up a stage result.
+
+        Args:
+            stage (str): Name of the stage.
+            fingerprint (str): Fingerprint of the media.
+            versions (dict): Versions of every model the stage depends on.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        key = self.key(stage, fingerprint, versions)
+        with self._lock:
+            if key in self.entries:
+                try:
+                    with open(self._path(key), 'r', encoding='utf-8') as file:
+                        value = json.load(file)
+                    os.utime(self._path(key))
+                    self.entries.move_to_end(key)
+                    self.hits[stage] = self.hits.get(stage, 0) + 1
+                    return value
+                except (OSError, ValueError):
+                    self._evict(key)
+            self.misses[stage] = self.misses.get(stage, 0) + 1
+            return None
+
+    def put(self, stage, fingerprint, versions, value):
+        """
+        Stores a stage result and evicts least recently used entries beyond the disk budget.
+
+        Args:
+            stage (str): Name of the stage.
+            fingerprint (str): Fingerprint of the media.
+            versions (dict): Versions of every model the stage depends on.
+            value: A JSON-serializable result.
+        """
+        key = self.key(stage, fingerprint, versions)
+        data = json.dumps(value).encode('utf-8')
+        with self._lock:
+            if len(data) > self.max_bytes:
+                return
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.tmp', delete=False) as file:
+                file.write(data)
+            os.replace(file.name, self._path(key))
+
+            self.total_bytes += len(data) - self.entries.pop(key, 0)
+            self.entries[key] = len(data)
+            while self.total_bytes > self.max_bytes:
+                self._evict(next(iter(self.entries)))
+
+    def _evict(self, key):
+        self.total_bytes -= self.entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def stats(self):
+        """
+        Returns hit-rate metrics for each stage.
+
+        Returns:
+            dict: Per-stage hits, misses and hit_rate, plus the number of entries and bytes used.
+        """
+        with self._lock:
+            stages = {}
+            for stage in set(self.hits) | set(self.misses):
+                hits = self.hits.get(stage, 0)
+                misses = self.misses.get(stage, 0)
+                stages[stage] = {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses)}
+            return {"stages": stages, "entries": len(self.entries), "bytes": self.total_bytes}
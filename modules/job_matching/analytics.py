@@ -0,0 +1,260 @@
+import datetime
+import os
+import threading
+import uuid
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+MATCH_SCHEMA = pa.schema([
+    ("resume_id", pa.string()),
+    ("job_id", pa.string()),
+    ("timestamp", pa.timestamp("us")),
+    ("match_date", pa.string()),
+    ("skill_match", pa.float64()),
+    ("education_match", pa.bool_()),
+    ("certification_match", pa.float64()),
+    ("experience_match", pa.bool_()),
+    ("total_match_score", pa.float64()),
+    ("resume_skills", pa.list_(pa.string())),
+    ("job_skills", pa.list_(pa.string())),
+    ("missing_skills", pa.list_(pa.string())),
+    ("resume_education", pa.list_(pa.string())),
+    ("resume_certifications", pa.list_(pa.string())),
+    ("resume_experience_years", pa.float64()),
+    ("job_experience_years", pa.float64()),
+])
+
+# Directory layout: match_date=YYYY-MM-DD/<batch>.parquet, rows sorted by job within each file
+PARTITIONING = ds.partitioning(pa.schema([("match_date", pa.string())]), flavor="hive")
+
+
+class MatchAnalyticsStore:
+    def __init__(self, root, batch_size=1000):
+        """
+        Initializes the MatchAnalyticsStore, a Parquet dataset of match results partitioned by day.
+
+        Each batch is written sorted by job, so Parquet row group statistics let queries for one
+        job skip most of a day's data. Small batches leave many files per day, so compact()
+        should run periodically to merge each finished day into a single file; serve.py runs it daily.
+
+        Args:
+            root (str): Directory holding the dataset; created if missing.
+            batch_size (int): Number of buffered rows that triggers a write.
+        """
+        self.root = root
+        self.batch_size = batch_size
+        self.buffer = []
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def append(self, resume_id, job_id, resume_data, job_data, match, timestamp=None):
+        """
+        Buffers one match result, writing the buffer out once it reaches batch_size rows.
+
+        Args:
+            resume_id (str): Identifier of the resume.
+            job_id (str): Identifier of the job.
+            resume_data (dict): Output of ResumeParser.summarize().
+            job_data (dict): Output of JobDescriptionParser.summarize().
+            match (dict): Output of ResumeJobMatcher.calculate_total_match_score().
+            timestamp (datetime.datetime): When the match was computed. Defaults to now.
+        """
+        timestamp = timestamp or datetime.datetime.now()
+        resume_skills = list(resume_data.get("skills", []))
+        job_skills = list(job_data.get("skills", []))
+        row = {
+            "resume_id": str(resume_id),
+            "job_id": str(job_id),
+            "timestamp": timestamp,
+            "match_date": timestamp.date().isoformat(),
+            "skill_match": float(match["skill_match"]),
+            "education_match": bool(match["education_match"]),
+            "certification_match": float(match["certification_match"]),
+            "experience_match": bool(match["experience_match"]),
+            "total_match_score": float(match["total_match_score"]),
+            "resume_skills": resume_skills,
+            "job_skills": job_skills,
+            "missing_skills": [skill for skill in job_skills if skill not in resume_skills],
+            "resume_education": list(resume_data.get("education", [])),
+            "resume_certifications": list(resume_data.get("certifications", [])),
+            "resume_experience_years": resume_data.get("experience_years"),
+            "job_experience_years": job_data.get("experience_years"),
+        }
+        with self._lock:
+            self.buffer.append(row)
+            if len(self.buffer) >= self.batch_size:
+                self._write()
+
+    def flush(self):
+        """Writes any buffered rows to the dataset."""
+        with self._lock:
+            self._write()
+
+    def _write(self):
+        if not self.buffer:
+            return
+        table = pa.Table.from_pylist(self.buffer, schema=MATCH_SCHEMA).sort_by([("job_id", "ascending")])
+        ds.write_dataset(
+            table, self.root, format="parquet", partitioning=PARTITIONING,
+            basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore", max_partitions=1 << 16,
+        )
+        self.buffer = []
+
+    def compact(self, before=None, row_group_size=65536):
+        """
+        Rewrites each day's batch files as one file sorted by job and time.
+
+        Each day is swapped under the store's lock, so queries running at the same time see either
+        the batch files or the compacted file, never both, and appends wait only for one day at a time.
+
+        Args:
+            before (datetime.date): Only compact days before this date. Defaults to today, leaving the
+                partition still being written alone.
+            row_group_size (int): Rows per Parquet row group in the compacted file.
+        """
+        before = (before or datetime.date.today()).isoformat()
+        self.flush()
+        for entry in os.scandir(self.root):
+            if not entry.is_dir() or not entry.name.startswith("match_date="):
+                continue
+            day = entry.name[len("match_date="):]
+            if day >= before:
+                continue
+            with self._lock:
+                files = [f.path for f in os.scandir(entry.path) if f.name.endswith(".parquet")]
+                if len(files) < 2:
+                    continue
+
+                table = pq.read_table(files, schema=MATCH_SCHEMA.remove(MATCH_SCHEMA.get_field_index("match_date")))
+                table = table.sort_by([("job_id", "ascending"), ("timestamp", "ascending")])
+                compacted = os.path.join(entry.path, f"{uuid.uuid4().hex}-compacted.parquet")
+                pq.write_table(table, compacted + ".tmp", row_group_size=row_group_size)
+                os.replace(compacted + ".tmp", compacted)
+                for path in files:
+                    os.remove(path)
+
+    def close(self):
+        """Flushes buffered rows; call before shutting down."""
+        self.flush()
+
+    def _read(self, columns, job_id=None, start=None, end=None):
+        """
+        Reads only the given columns, pruning partitions by date and row groups by job.
+
+        Rows still in the write buffer are filtered in memory and included, without writing them out.
+
+        Args:
+            columns (list): Columns to read.
+            job_id (str): Only read matches for this job, or None for all jobs.
+            start (datetime.datetime): Only read matches at or after this time.
+            end (datetime.datetime): Only read matches before this time.
+
+        Returns:
+            pyarrow.Table: The matching rows.
+        """
+        conditions = []
+        if job_id is not None:
+            conditions.append(ds.field("job_id") == str(job_id))
+        if start is not None:
+            conditions.append(ds.field("match_date") >= start.date().isoformat())
+            conditions.append(ds.field("timestamp") >= pa.scalar(start, pa.timestamp("us")))
+        if end is not None:
+            conditions.append(ds.field("match_date") <= end.date().isoformat())
+            conditions.append(ds.field("timestamp") < pa.scalar(end, pa.timestamp("us")))
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        while True:
+            # Files are listed when the dataset is created, so together with the buffer copy this is one snapshot
+            with self._lock:
+                dataset = ds.dataset(self.root, format="parquet", partitioning=PARTITIONING, schema=MATCH_SCHEMA)
+                buffered = list(self.buffer)
+            try:
+                table = dataset.to_table(columns=columns, filter=expression)
+                break
+            except FileNotFoundError:
+                # compact() replaced a listed file before it was read. A new listing only
+                # holds files that exist, so this retries at most once per compacted day.
+                continue
+        if not buffered:
+            return table
+        buffered = pa.Table.from_pylist(buffered, schema=MATCH_SCHEMA)
+        if expression is not None:
+            buffered = buffered.filter(expression)
+        return pa.concat_tables([table, buffered.select(columns)])
+
+    def skill_gap_distribution(self, job_id, start=None, end=None):
+        """
+        Counts how often candidates matched against a job were missing each of its skills.
+
+        Args:
+            job_id (str): Identifier of the job.
+            start (datetime.datetime): Only count matches at or after this time.
+            end (datetime.datetime): Only count matches before this time.
+
+        Returns:
+            dict: Skill -> {"missing": count, "fraction": share of matched candidates}, most missed first.
+        """
+        table = self._read(["missing_skills"], job_id, start, end)
+        if table.num_rows == 0:
+            return {}
+        counts = pc.value_counts(pc.list_flatten(table["missing_skills"]))
+        gaps = {
+            item["values"].as_py(): item["counts"].as_py() for item in counts
+        }
+        return {
+            skill: {"missing": count, "fraction": count / table.num_rows}
+            for skill, count in sorted(gaps.items(), key=lambda item: item[1], reverse=True)
+        }
+
+    def score_histogram(self, job_id=None, bins=10, start=None, end=None):
+        """
+        Buckets total match scores into equal-width bins from 0 to 100.
+
+        Args:
+            job_id (str): Only include matches for this job, or None for all jobs.
+            bins (int): Number of bins.
+            start (datetime.datetime): Only include matches at or after this time.
+            end (datetime.datetime): Only include matches before this time.
+
+        Returns:
+            list: {"start", "end", "count"} dicts, one per bin.
+        """
+        table = self._read(["total_match_score"], job_id, start, end)
+        scores = table["total_match_score"].to_numpy()
+        counts, edges = np.histogram(np.clip(scores, 0, 100), bins=bins, range=(0, 100))
+        return [
+            {"start": float(edges[i]), "end": float(edges[i + 1]), "count": int(counts[i])}
+            for i in range(bins)
+        ]
+
+    def top_candidates(self, job_id=None, limit=10, start=None, end=None):
+        """
+        Returns the best-scoring candidates, keeping each resume's highest score.
+
+        Args:
+            job_id (str): Only include matches for this job, or None for all jobs.
+            limit (int): Number of candidates to return.
+            start (datetime.datetime): Only include matches at or after this time.
+            end (datetime.datetime): Only include matches before this time.
+
+        Returns:
+            list: {"resume_id", "total_match_score", "matches"} dicts, best first.
+        """
+        table = self._read(["resume_id", "total_match_score"], job_id, start, end)
+        if table.num_rows == 0:
+            return []
+        grouped = table.group_by("resume_id").aggregate([("total_match_score", "max"), ("total_match_score", "count")])
+        indices = pc.select_k_unstable(grouped, limit, [("total_match_score_max", "descending")])
+        best = grouped.take(indices).sort_by([("total_match_score_max", "descending"), ("resume_id", "ascending")])
+        return [
+            {"resume_id": row["resume_id"], "total_match_score": row["total_match_score_max"],
+             "matches": row["total_match_score_count"]}
+            for row in best.to_pylist()
+        ]
@@ -0,0 +1,201 @@
+import re
+import zlib
+import numpy as np
+
+# Mersenne prime used by the universal hash family, and the mask that keeps
+# every permuted value inside 32 bits.
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class ResumeDeduplicator:
+    def __init__(self, num_perm=128, bands=32, shingle_size=5, threshold=0.8, seed=1, max_documents=None):
+        """
+        Initializes the ResumeDeduplicator with an empty MinHash/LSH index.
+
+        Args:
+            num_perm (int): Number of hash permutations in each MinHash signature.
+            bands (int): Number of LSH bands; must divide num_perm evenly.
+            shingle_size (int): Number of consecutive words in each shingle.
+            threshold (float): Minimum estimated Jaccard similarity to treat two resumes as near-duplicates.
+            seed (int): Seed for the permutation coefficients, so signatures are stable across runs.
+            max_documents (int): Maximum number of resumes to index, or None for no limit. The least
+                recently matched resumes are evicted first; collapsed duplicates are capped the same way.
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands.")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.max_documents = max_documents
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = generator.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+        self.signatures = {}  # doc_id -> MinHash signature of every indexed resume, least recently matched first
+        self.duplicates = {}  # doc_id -> canonical doc_id for collapsed near-duplicates, oldest first
+        self.buckets = [{} for _ in range(bands)]  # band -> {band key: [doc_id, ...]}
+
+    def shingle(self, text):
+        """
+        Splits text into overlapping word shingles.
+
+        Args:
+            text (str): The text to shingle.
+
+        Returns:
+            set: A set of shingles, each a space-joined run of shingle_size lowercase words.
+        """
+        words = re.findall(r'\w+', text.lower())
+        if len(words) <= self.shingle_size:
+            return {' '.join(words)} if words else set()
+        return {' '.join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, text):
+        """
+        Computes the MinHash signature of the text.
+
+        Args:
+            text (str): The text to sign.
+
+        Returns:
+            numpy.ndarray: An array of num_perm unsigned integers.
+        """
+        shingles = self.shingle(text)
+        if not shingles:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+
+        hashes = np.array([zlib.crc32(s.encode('utf-8')) for s in shingles], dtype=np.uint64)
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def similarity(self, signature_a, signature_b):
+        """
+        Estimates the Jaccard similarity of two documents from their signatures.
+
+        Args:
+            signature_a (numpy.ndarray): MinHash signature of the first document.
+            signature_b (numpy.ndarray): MinHash signature of the second document.
+
+        Returns:
+            float: Fraction of signature positions that agree, between 0 and 1.
+        """
+        return float(np.count_nonzero(signature_a == signature_b)) / self.num_perm
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def query(self, text=None, signature=None):
+        """
+        Finds indexed resumes that are near-duplicates of the given text.
+
+        Only documents sharing at least one LSH bucket with the query are compared,
+        so lookups do not scan the whole index.
+
+        Args:
+            text (str): The text to look up. Ignored if signature is given.
+            signature (numpy.ndarray): A precomputed MinHash signature.
+
+        Returns:
+            list: (doc_id, similarity) tuples above the threshold, most similar first.
+        """
+        if signature is None:
+            signature = self.signature(text)
+
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self.buckets[band].get(key, ()))
+
+        matches = []
+        for doc_id in candidates:
+            score = self.similarity(signature, self.signatures[doc_id])
+            if score >= self.threshold:
+                matches.append((doc_id, score))
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def add(self, doc_id, text):
+        """
+        Indexes a resume, collapsing it onto an existing one if it is a near-duplicate.
+
+        Re-adding a doc_id whose earlier version is a near-duplicate of the new text returns the doc_id
+        itself, so resubmissions under the same id are reported too.
+
+        Args:
+            doc_id (str): Unique identifier of the resume, e.g. a hash of its text. Filenames are not
+                unique across candidates.
+            text (str): The extracted resume text.
+
+        Returns:
+            str or None: The canonical doc_id this resume duplicates, or None if it was indexed as new.
+        """
+        signature = self.signature(text)
+        matches = self.query(signature=signature)
+        if matches:
+            canonical_id = matches[0][0]
+            if canonical_id != doc_id:
+                self.remove(doc_id)  # An earlier, different version under the same name
+                self.duplicates[doc_id] = canonical_id
+            # Mark the canonical resume as recently matched
+            self.signatures[canonical_id] = self.signatures.pop(canonical_id)
+            self._evict()
+            return canonical_id
+
+        self.remove(doc_id)
+        self.signatures[doc_id] = signature
+        for band, key in self._band_keys(signature):
+            self.buckets[band].setdefault(key, []).append(doc_id)
+        self._evict()
+        return None
+
+    def _evict(self):
+        if self.max_documents is None:
+            return
+        while len(self.signatures) > self.max_documents:
+            self.remove(next(iter(self.signatures)))
+        while len(self.duplicates) > self.max_documents:
+            self.duplicates.pop(next(iter(self.duplicates)))
+
+    def remove(self, doc_id):
+        """
+        Removes a resume from the index.
+
+        Duplicates collapsed onto a removed resume are dropped as well.
+
+        Args:
+            doc_id (str): Identifier of the resume to remove.
+        """
+        if self.duplicates.pop(doc_id, None) is not None:
+            return
+
+        signature = self.signatures.pop(doc_id, None)
+        if signature is None:
+            return
+
+        for band, key in self._band_keys(signature):
+            bucket = self.buckets[band].get(key, [])
+            if doc_id in bucket:
+                bucket.remove(doc_id)
+            if not bucket:
+                self.buckets[band].pop(key, None)
+
+        self.duplicates = {dup: canonical for dup, canonical in self.duplicates.items() if canonical != doc_id}
+
+    def canonical_id(self, doc_id):
+        """
+        Returns the canonical resume a doc_id was collapsed onto.
+
+        Args:
+            doc_id (str): Identifier of a previously added resume.
+
+        Returns:
+            str: The canonical doc_id, or doc_id itself if it is not a duplicate.
+        """
+        return self.duplicates.get(doc_id, doc_id)
+
+    def __len__(self):
+        return len(self.signatures)
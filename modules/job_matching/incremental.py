@@ -0,0 +1,343 @@
+import bisect
+from modules.job_matching.matching import ResumeJobMatcher
+
+# Each match component, the parsed fields it depends on, and the ResumeJobMatcher method computing it
+COMPONENTS = {
+    "skill_match": (("skills",), "calculate_skill_match"),
+    "education_match": (("education",), "calculate_education_match"),
+    "certification_match": (("certifications", "certification_ids"), "calculate_certification_match"),
+    "experience_match": (("experience", "experience_years"), "calculate_experience_match"),
+}
+
+
+class IncrementalMatcher:
+    def __init__(self, skills, weights=None, total_weight=None):
+        """
+        Initializes the IncrementalMatcher, a materialized table of resume/job match scores.
+
+        Each document's text is scanned for a skill only once, when the document or the skill is
+        added, and the resulting occurrences are kept in an inverted index. Changing the skill
+        vocabulary, the weights or a document then recomputes only the match components and
+        pairs that depend on the change. Each job's ranking is kept sorted as scores change, and
+        the change log records the rank moves of the rescored pairs.
+
+        Args:
+            skills (list): The skill vocabulary.
+            weights (dict): Weight of each match component. Defaults to ResumeJobMatcher.DEFAULT_WEIGHTS.
+            total_weight (float): Divisor applied to the weighted sum. Defaults to ResumeJobMatcher.DEFAULT_TOTAL_WEIGHT.
+        """
+        self.skills = list(skills)
+        self.weights = weights or ResumeJobMatcher.DEFAULT_WEIGHTS
+        self.total_weight = total_weight or ResumeJobMatcher.DEFAULT_TOTAL_WEIGHT
+
+        self.texts = {"resume": {}, "job": {}}  # kind -> doc_id -> lowercased text
+        self.data = {"resume": {}, "job": {}}  # kind -> doc_id -> parsed data with skills from the index
+        self.postings = {}  # skill -> {"resume": set of doc_ids, "job": set of doc_ids}
+        self.components = {}  # (resume_id, job_id) -> component scores
+        self.totals = {}  # (resume_id, job_id) -> total match score
+        self.ranked = {}  # job_id -> sorted list of (-total match score, resume_id)
+        self.change_log = []
+        self.components_computed = 0
+
+    def _scan(self, kind, doc_id, skills):
+        """Records which of the given skills occur in a document."""
+        text = self.texts[kind][doc_id]
+        for skill in skills:
+            if skill.lower() in text:
+                self.postings.setdefault(skill, {"resume": set(), "job": set()})[kind].add(doc_id)
+
+    def _discard(self, kind, doc_id):
+        """Removes a document from every posting, before it is rescanned or removed."""
+        for postings in self.postings.values():
+            postings[kind].discard(doc_id)
+
+    def _skills_of(self, kind, doc_id):
+        return [skill for skill in self.skills if doc_id in self.postings.get(skill, {}).get(kind, ())]
+
+    def _score(self, pairs, components):
+        """Recomputes the given components and the total for each (resume_id, job_id) pair."""
+        for resume_id, job_id in pairs:
+            matcher = ResumeJobMatcher(
+                self.data["resume"][resume_id], self.data["job"][job_id], self.weights, self.total_weight
+            )
+            scores = self.components.setdefault((resume_id, job_id), {})
+            for component in components:
+                scores[component] = getattr(matcher, COMPONENTS[component][1])()
+                self.components_computed += 1
+            self._set_total(resume_id, job_id, matcher.combine_scores(scores))
+
+    def _set_total(self, resume_id, job_id, total):
+        """Stores a pair's total and moves the resume to its place in the job's ranking."""
+        self._unrank(resume_id, job_id)
+        self.totals[(resume_id, job_id)] = total
+        bisect.insort(self.ranked.setdefault(job_id, []), (-total, resume_id))
+
+    def _unrank(self, resume_id, job_id):
+        """Removes a pair's total and takes the resume out of the job's ranking."""
+        total = self.totals.pop((resume_id, job_id), None)
+        if total is not None:
+            ranked = self.ranked[job_id]
+            del ranked[bisect.bisect_left(ranked, (-total, resume_id))]
+
+    def _ranks(self, pairs):
+        """Returns the rank of each (resume_id, job_id) pair in its job's ranking, or None if it is not ranked."""
+        ranks = {}
+        for resume_id, job_id in pairs:
+            total = self.totals.get((resume_id, job_id))
+            ranks[(resume_id, job_id)] = (
+                None if total is None else bisect.bisect_left(self.ranked[job_id], (-total, resume_id)) + 1
+            )
+        return ranks
+
+    def _record(self, reason, before):
+        """
+        Appends the rank moves of the rescored pairs to the change log, grouped by job.
+
+        Args:
+            reason (str): Description of the change.
+            before (dict): Rank of each rescored pair before the change, from _ranks().
+
+        Returns:
+            list: The new change log entries.
+        """
+        moves = {}
+        for pair, new_rank in self._ranks(before).items():
+            if new_rank != before[pair]:
+                moves.setdefault(pair[1], []).append((pair[0], before[pair], new_rank))
+        entries = [
+            {"reason": reason, "job_id": job_id,
+             "moves": sorted(job_moves, key=lambda move: (move[2] is None, move[2] or 0, move[0]))}
+            for job_id, job_moves in moves.items()
+        ]
+        self.change_log.extend(entries)
+        return entries
+
+    def _add(self, kind, doc_id, text, data):
+        self._discard(kind, doc_id)
+        self.texts[kind][doc_id] = text.lower()
+        self._scan(kind, doc_id, self.skills)
+        self.data[kind][doc_id] = dict(data, skills=self._skills_of(kind, doc_id))
+
+    def _update(self, kind, doc_id, text, data):
+        """
+        Replaces a document's text or parsed data, rescanning it only if its text changed.
+
+        Returns:
+            list: The match components whose fields changed.
+        """
+        old_data = self.data[kind][doc_id]
+        new_data = dict(old_data if data is None else data)
+        if text is not None and text.lower() != self.texts[kind][doc_id]:
+            self._discard(kind, doc_id)
+            self.texts[kind][doc_id] = text.lower()
+            self._scan(kind, doc_id, self.skills)
+        new_data["skills"] = self._skills_of(kind, doc_id)
+        self.data[kind][doc_id] = new_data
+        return [c for c, (fields, _) in COMPONENTS.items()
+                if any(new_data.get(field) != old_data.get(field) for field in fields)]
+
+        """Appends the rank changes of each job to the change log."""
+        entries = []
+        for job_id in job_ids:
+            old_ranks = {resume_id: rank for rank, (resume_id, _) in enumerate(before.get(job_id, []), 1)}
+            moves = []
+            for rank, (resume_id, _) in enumerate(self.ranking(job_id), 1):
+                if old_ranks.get(resume_id) != rank:
+                    moves.append((resume_id, old_ranks.get(resume_id), rank))
+            if moves:
+                entries.append({"reason": reason, "job_id": job_id, "moves": moves})
+        self.change_log.extend(entries)
+        return entries
+
+    def add_resumes(self, resumes):
+        """
+        Adds resumes and scores them against every job.
+
+        A resume added again under an existing id replaces the earlier one.
+
+        Args:
+            resumes (iterable): (resume_id, resume_text, resume_data) tuples, where resume_data is the output
+                of ResumeParser.summarize(); its skills are replaced by the index.
+
+        Returns:
+            list: Change log entries for the rankings the resumes entered.
+        """
+        resumes = list(resumes)
+        before = self._ranks((resume_id, job_id) for resume_id, _, _ in resumes for job_id in self.data["job"])
+        for resume_id, resume_text, resume_data in resumes:
+            self._add("resume", resume_id, resume_text, resume_data)
+            self._score([(resume_id, job_id) for job_id in self.data["job"]], COMPONENTS)
+        return self._record("added resumes", before)
+
+    def add_resume(self, resume_id, resume_text, resume_data):
+        """
+        Adds a single resume and scores it against every job.
+
+        Args:
+            resume_id (str): Identifier of the resume.
+            resume_text (str): The extracted resume text.
+            resume_data (dict): Output of ResumeParser.summarize(); its skills are replaced by the index.
+
+        Returns:
+            list: Change log entries for the rankings this resume entered.
+        """
+        return self.add_resumes([(resume_id, resume_text, resume_data)])
+
+    def update_resume(self, resume_id, resume_text=None, resume_data=None):
+        """
+        Updates a resume's text or parsed data and rescores only the components that changed.
+
+        Args:
+            resume_id (str): Identifier of an existing resume.
+            resume_text (str): The new resume text, or None to keep the current one.
+            resume_data (dict): The new parsed data, or None to keep the current data.
+
+        Returns:
+            list: Change log entries for the rankings the resume moved in.
+        """
+        pairs = [(resume_id, job_id) for job_id in self.data["job"]]
+        before = self._ranks(pairs)
+        changed = self._update("resume", resume_id, resume_text, resume_data)
+        if changed:
+            self._score(pairs, changed)
+        return self._record(f"updated resume {resume_id}", before)
+
+    def remove_resume(self, resume_id):
+        """
+        Removes a resume and its scores.
+
+        Args:
+            resume_id (str): Identifier of an existing resume.
+
+        Returns:
+            list: Change log entries for the rankings the resume left.
+        """
+        before = self._ranks((resume_id, job_id) for job_id in self.data["job"])
+        for job_id in self.data["job"]:
+            self._unrank(resume_id, job_id)
+            self.components.pop((resume_id, job_id), None)
+        self._discard("resume", resume_id)
+        del self.texts["resume"][resume_id]
+        del self.data["resume"][resume_id]
+        return self._record(f"removed resume {resume_id}", before)
+
+    def add_job(self, job_id, job_text, job_data):
+        """
+        Adds a job and scores every resume against it.
+
+        Args:
+            job_id (str): Identifier of the job.
+            job_text (str): The extracted job description text.
+            job_data (dict): Output of JobDescriptionParser.summarize(); its skills are replaced by the index.
+        """
+        self._add("job", job_id, job_text, job_data)
+        self._score([(resume_id, job_id) for resume_id in self.data["resume"]], COMPONENTS)
+
+    def update_job(self, job_id, job_text=None, job_data=None):
+        """
+        Updates a job's text or requirements and rescores only the components that changed.
+
+        Args:
+            job_id (str): Identifier of an existing job.
+            job_text (str): The new job description text, or None to keep the current one.
+            job_data (dict): The new parsed requirements, or None to keep the current ones.
+
+        Returns:
+            list: Change log entries for the job's ranking.
+        """
+        pairs = [(resume_id, job_id) for resume_id in self.data["resume"]]
+        before = self._ranks(pairs)
+        changed = self._update("job", job_id, job_text, job_data)
+        if changed:
+            self._score(pairs, changed)
+        return self._record(f"updated job {job_id}", before)
+
+    def set_skills(self, skills):
+        """
+        Replaces the skill vocabulary.
+
+        Only newly added skills are scanned for, and only the skill component of pairs whose
+        resume or job gained or lost a skill is recomputed.
+
+        Args:
+            skills (list): The new skill vocabulary.
+
+        Returns:
+            list: Change log entries for every ranking that moved.
+        """
+        added = [skill for skill in skills if skill not in self.skills]
+        removed = [skill for skill in self.skills if skill not in skills]
+
+        changed = {"resume": set(), "job": set()}
+        for skill in removed:
+            for kind, doc_ids in self.postings.pop(skill, {}).items():
+                changed[kind].update(doc_ids)
+        for kind in ("resume", "job"):
+            for doc_id in self.texts[kind]:
+                self._scan(kind, doc_id, added)
+        for skill in added:
+            for kind, doc_ids in self.postings.get(skill, {}).items():
+                changed[kind].update(doc_ids)
+
+        self.skills = list(skills)
+        for kind in ("resume", "job"):
+            for doc_id in changed[kind]:
+                self.data[kind][doc_id]["skills"] = self._skills_of(kind, doc_id)
+
+        pairs = {(resume_id, job_id) for resume_id in changed["resume"] for job_id in self.data["job"]}
+        pairs.update((resume_id, job_id) for resume_id in self.data["resume"] for job_id in changed["job"])
+        before = self._ranks(pairs)
+        self._score(pairs, ["skill_match"])
+        return self._record("changed skill vocabulary", before)
+
+    def set_weights(self, weights, total_weight=None):
+        """
+        Replaces the component weights and recomputes totals from the stored components.
+
+        Args:
+            weights (dict): Weight of each match component.
+            total_weight (float): Divisor applied to the weighted sum, or None to keep the current one.
+
+        Returns:
+            list: Change log entries for every ranking that moved.
+        """
+        before = self._ranks(self.totals)
+        self.weights = weights
+        self.total_weight = total_weight or self.total_weight
+        matcher = ResumeJobMatcher({}, {}, self.weights, self.total_weight)
+        for pair, scores in self.components.items():
+            self.totals[pair] = matcher.combine_scores(scores)
+        # Every total changed, so re-sort each ranking once instead of moving resumes one by one
+        self.ranked = {job_id: [] for job_id in self.data["job"]}
+        for (resume_id, job_id), total in self.totals.items():
+            self.ranked[job_id].append((-total, resume_id))
+        for ranked in self.ranked.values():
+            ranked.sort()
+        return self._record("changed weights", before)
+
+    def scores(self, resume_id, job_id):
+        """
+        Returns the materialized match breakdown of a pair.
+
+        Args:
+            resume_id (str): Identifier of the resume.
+            job_id (str): Identifier of the job.
+
+        Returns:
+            dict: The same breakdown as ResumeJobMatcher.calculate_total_match_score().
+        """
+        return dict(self.components[(resume_id, job_id)], total_match_score=self.totals[(resume_id, job_id)])
+
+    def ranking(self, job_id, top_k=None):
+        """
+        Ranks resumes for a job by total match score.
+
+        Args:
+            job_id (str): Identifier of the job.
+            top_k (int): Number of results to return, or None for all.
+
+        Returns:
+            list: (resume_id, total_match_score) tuples, best first.
+        """
+        ranked = self.ranked.get(job_id, [])
+        return [(resume_id, -total) for total, resume_id in (ranked[:top_k] if top_k is not None else ranked)]
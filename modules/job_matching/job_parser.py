@@ -1,5 +1,5 @@
-import re
 import spacy
+from modules.job_matching.rules import DEFAULT_ENGINE
 
 class JobDescriptionParser:
     def __init__(self, job_description):
@@ -12,6 +12,7 @@ class JobDescriptionParser:
         self.job_description = job_description
         self.nlp = spacy.load("en_core_web_sm")
         self.doc = self.nlp(job_description)
+        self.extracted = DEFAULT_ENGINE.extract(job_description)
 
     def extract_skills(self, skills_list):
         """
@@ -44,9 +45,7 @@ class JobDescriptionParser:
         Returns:
             list: A list of certifications found.
         """
-        certification_pattern = r'(certified [\w ]+|\b(?:cisco|aws|pmp|cpa|scrum|google)[\w ]* certification\b)'
-        certifications = re.findall(certification_pattern, self.job_description, re.IGNORECASE)
-        return [cert.strip() for cert in certifications]
+        return [cert["text"] for cert in self.extracted["certifications"]]
 
     def extract_experience(self):
         """
@@ -55,9 +54,17 @@ class JobDescriptionParser:
         Returns:
             list: A list of experience details found.
         """
-        experience_pattern = r'\b(\d+\+? years? of experience)\b'
-        experience_matches = re.findall(experience_pattern, self.job_description, re.IGNORECASE)
-        return experience_matches
+        return [experience["text"] for experience in self.extracted["experience"]]
+
+    def extract_experience_years(self):
+        """
+        Extracts the required years of experience as a number.
+
+        Returns:
+            int: Years stated by the first experience requirement, or 0 if there is none.
+        """
+        experience = self.extracted["experience"]
+        return experience[0]["years"] if experience else 0
 
     def summarize(self, skills_list):
         """
@@ -74,6 +81,8 @@ class JobDescriptionParser:
             "education": self.extract_education(),
             "certifications": self.extract_certifications(),
             "experience": self.extract_experience(),
+            "experience_years": self.extract_experience_years(),
+            "certification_ids": self.extracted["certification_ids"],
         }
 
 
@@ -1,14 +1,27 @@
 class ResumeJobMatcher:
-    def __init__(self, resume_data, job_data):
+    # Weight of each match component and the divisor applied to their weighted sum
+    DEFAULT_WEIGHTS = {
+        "skill_match": 2,  # Skills weighted higher
+        "education_match": 1,
+        "certification_match": 1,
+        "experience_match": 1,
+    }
+    DEFAULT_TOTAL_WEIGHT = 4
+
+    def __init__(self, resume_data, job_data, weights=None, total_weight=None):
         """
         Initializes the ResumeJobMatcher with resume and job data.
 
         Args:
             resume_data (dict): Extracted data from the resume (skills, education, certifications, experience, etc.).
             job_data (dict): Parsed job description data (skills, education, certifications, experience requirements, etc.).
+            weights (dict): Weight of each match component. Defaults to DEFAULT_WEIGHTS.
+            total_weight (float): Divisor applied to the weighted sum. Defaults to DEFAULT_TOTAL_WEIGHT.
         """
         self.resume_data = resume_data
         self.job_data = job_data
+        self.weights = weights or self.DEFAULT_WEIGHTS
+        self.total_weight = total_weight or self.DEFAULT_TOTAL_WEIGHT
 
     def calculate_skill_match(self):
         """
@@ -50,8 +63,11 @@ class ResumeJobMatcher:
         Returns:
             float: Certification match percentage.
         """
-        resume_certifications = set(self.resume_data.get("certifications", []))
-        job_certifications = set(self.job_data.get("certifications", []))
+        # Compare normalized certification ids when both sides were parsed by the rule engine
+        key = "certification_ids" if "certification_ids" in self.resume_data and "certification_ids" in self.job_data \
+            else "certifications"
+        resume_certifications = set(self.resume_data.get(key, []))
+        job_certifications = set(self.job_data.get(key, []))
 
         # If either the job or resume certifications are missing or empty, return 0
         if not job_certifications or not resume_certifications:
@@ -95,6 +111,10 @@ class ResumeJobMatcher:
         Returns:
             bool: True if the resume meets or exceeds the required experience, otherwise False.
         """
+        # Compare numeric years when both sides were parsed by the rule engine
+        if "experience_years" in self.resume_data and "experience_years" in self.job_data:
+            return self.resume_data["experience_years"] >= self.job_data["experience_years"]
+
         job_experience = self.job_data.get("experience", "0 years")
         resume_experience = self.resume_data.get("experience", ["0 years"])
 
@@ -106,6 +126,25 @@ class ResumeJobMatcher:
 
         return resume_years >= job_years
 
+    def combine_scores(self, scores):
+        """
+        Combines individual match components into the total match percentage.
+
+        Args:
+            scores (dict): Component scores keyed like DEFAULT_WEIGHTS; percentages for skills and
+                certifications, booleans for education and experience.
+
+        Returns:
+            float: The weighted total match percentage.
+        """
+        match_score = (
+            (scores["skill_match"] / 100) * self.weights["skill_match"] +
+            (scores["education_match"] * self.weights["education_match"]) +
+            (scores["certification_match"] / 100) * self.weights["certification_match"] +
+            (scores["experience_match"] * self.weights["experience_match"])
+        ) / self.total_weight * 100
+        return match_score
+
     def calculate_total_match_score(self):
         """
         Calculates an overall match score based on skills, education, certifications, and experience.
@@ -113,24 +152,11 @@ class ResumeJobMatcher:
         Returns:
             dict: A dictionary with detailed match scores and the total match percentage.
         """
-        skill_match = self.calculate_skill_match()
-        education_match = self.calculate_education_match()
-        certification_match = self.calculate_certification_match()
-        experience_match = self.calculate_experience_match()
-
-        # Adjust total_weight to handle the importance of each match component
-        total_weight = 4  # Adjust weights as needed
-        match_score = (
-            (skill_match / 100) * 2 +  # Skills weighted higher
-            (education_match * 1) +
-            (certification_match / 100) * 1 +
-            (experience_match * 1)
-        ) / total_weight * 100
-
-        return {
-            "skill_match": skill_match,
-            "education_match": education_match,
-            "certification_match": certification_match,
-            "experience_match": experience_match,
-            "total_match_score": match_score
+        scores = {
+            "skill_match": self.calculate_skill_match(),
+            "education_match": self.calculate_education_match(),
+            "certification_match": self.calculate_certification_match(),
+            "experience_match": self.calculate_experience_match(),
         }
+        scores["total_match_score"] = self.combine_scores(scores)
+        return scores
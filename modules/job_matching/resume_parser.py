@@ -1,5 +1,5 @@
-import re
 import spacy
+from modules.job_matching.rules import DEFAULT_ENGINE
 
 class ResumeParser:
     def __init__(self, resume_text):
@@ -12,6 +12,7 @@ class ResumeParser:
         self.resume_text = resume_text
         self.nlp = spacy.load("en_core_web_sm")
         self.doc = self.nlp(resume_text)
+        self.extracted = DEFAULT_ENGINE.extract(resume_text)
 
     def extract_skills(self, skills_list):
         """
@@ -44,9 +45,7 @@ class ResumeParser:
         Returns:
             list: A list of certifications found.
         """
-        certification_pattern = r'(certified [\w ]+|\b(?:cisco|aws|pmp|cpa|scrum|google)[\w ]* certification\b)'
-        certifications = re.findall(certification_pattern, self.resume_text, re.IGNORECASE)
-        return [cert.strip() for cert in certifications]
+        return [cert["text"] for cert in self.extracted["certifications"]]
 
     def extract_experience(self):
         """
@@ -55,26 +54,30 @@ class ResumeParser:
         Returns:
             list: A list of experience details found.
         """
-        experience_pattern = r'\b(\d+\+? years? of experience)\b'
-        experience_matches = re.findall(experience_pattern, self.resume_text, re.IGNORECASE)
-        return experience_matches
+        return [experience["text"] for experience in self.extracted["experience"]]
 
     def extract_contact_information(self):
         """
         Extracts contact information such as email and phone number from the resume.
 
         Returns:
-            dict: A dictionary containing email and phone number.
+            dict: Normalized emails (lowercased) and phone numbers (digits only, without a leading US country code).
         """
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        phone_pattern = r'\b\d{10}\b|\(\d{3}\) \d{3}-\d{4}'
-        email_matches = re.findall(email_pattern, self.resume_text)
-        phone_matches = re.findall(phone_pattern, self.resume_text)
         return {
-            "email": email_matches,
-            "phone": phone_matches
+            "email": list(dict.fromkeys(email["value"] for email in self.extracted["emails"])),
+            "phone": list(dict.fromkeys(phone["value"] for phone in self.extracted["phones"]))
         }
 
+    def extract_structured(self):
+        """
+        Returns the typed values found by the rule engine in a single scan of the resume.
+
+        Returns:
+            dict: Experience statements, employment date spans, total and overall years of experience,
+                certifications with normalized ids, and normalized emails and phone numbers.
+        """
+        return self.extracted
+
     def summarize(self, skills_list):
         """
         Summarizes all extracted information from the resume.
@@ -90,6 +93,8 @@ class ResumeParser:
             "education": self.extract_education(),
             "certifications": self.extract_certifications(),
             "experience": self.extract_experience(),
+            "experience_years": self.extracted["experience_years"],
+            "certification_ids": self.extracted["certification_ids"],
             "contact_information": self.extract_contact_information()
         }
 
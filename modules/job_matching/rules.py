@@ -0,0 +1,250 @@
+import bisect
+import datetime
+import re
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_YEAR = r'(?:19|20)\d{2}'
+
+# Certifications usually written as a bare acronym
+CERTIFICATION_ACRONYMS = ["pmp", "cpa", "cissp", "cisa", "cism", "ccna", "ccnp", "csm"]
+
+
+def _experience(text, groups, today):
+    return {
+        "text": text,
+        "years": int(groups["years"]),
+        "minimum": groups["plus"] is not None,
+    }
+
+
+def _date_span(text, groups, today):
+    start = (int(groups["start_year"]), MONTHS[groups["start_month"][:3].lower()] if groups["start_month"] else 1)
+    if groups["end_year"] and groups["end_month"]:
+        end = (int(groups["end_year"]), MONTHS[groups["end_month"][:3].lower()])
+    elif groups["end_year"]:
+        # Without an end month the span ends where the start month falls in the end year,
+        # so "2016 - 2020" is 4 years (Jan 2016 through Dec 2019)
+        month_index = int(groups["end_year"]) * 12 + start[1] - 2
+        end = (month_index // 12, month_index % 12 + 1)
+    else:
+        end = (today.year, today.month)
+    months = (end[0] - start[0]) * 12 + end[1] - start[1] + 1
+    if months <= 0:
+        return None
+    return {"text": text, "start": start, "end": end, "months": months}
+
+
+def _certification(text, groups, today):
+    text = text.strip()
+    return {"text": text, "id": re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')}
+
+
+def _email(text, groups, today):
+    return {"text": text, "value": text.lower()}
+
+
+def _phone(text, groups, today):
+    digits = re.sub(r'\D', '', text)
+    if len(digits) == 11 and digits.startswith('1'):
+        digits = digits[1:]
+    return {"text": text, "value": digits}
+
+
+# (rule name, pattern, converter); earlier rules win where patterns overlap.
+# Patterns are lowercase and must start at a token boundary. Group names must be unique
+# across rules since all patterns share one compiled regex.
+RULES = [
+    ("emails", r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}', _email),
+    ("date_spans",
+     rf'\b(?:(?P<start_month>{_MONTH})\s+)?(?P<start_year>{_YEAR})\s*(?:-|–|—|to|until)\s*'
+     rf'(?:(?:(?P<end_month>{_MONTH})\s+)?(?P<end_year>{_YEAR})\b|(?:present|current|now|today)\b)',
+     _date_span),
+    ("experience", r'\b(?P<years>\d+)(?P<plus>\+)?\s?years?\s+of\s+experience\b', _experience),
+    ("phones", r'(?<!\d)(?:\+?1[\s.-]?)?(?:\(\d{3}\)\s?|\d{3}[\s.-]?)\d{3}[\s.-]?\d{4}(?!\d)', _phone),
+    ("certifications",
+     r'\b(?:(?:aws|cisco|google|microsoft|oracle|salesforce)\s+)?certified [\w ]+'
+     r'|\b(?:cisco|aws|pmp|cpa|scrum|google)[\w ]* certification\b'
+     rf'|\b(?:{"|".join(CERTIFICATION_ACRONYMS)})\b',
+     _certification),
+]
+
+
+# Section headings, matched on whole lines
+_HEADING = (
+    r'^[ \t]*(?:(?P<employment>(?:work |professional |employment |career )?(?:experience|history)|employment)'
+    r'|education|academic background|qualifications|training|skills|certifications?|projects|summary|profile'
+    r'|awards|publications|languages|interests|references|volunteering|volunteer experience)[ \t]*:?[ \t]*$'
+)
+# Lines describing study rather than work
+_EDUCATION_LINE = (
+    r"\b(?:bachelor|master|ph\.?d|doctorate|mba|b\.?sc|m\.?sc|b\.?a|m\.?a|diploma|degree|university|college"
+    r"|school|institute|academy|graduat\w*|coursework|gpa)\b"
+)
+# Job titles and company suffixes that mark an employment entry outside an experience section
+_EMPLOYMENT_LINE = (
+    r'\b(?:engineer|developer|manager|analyst|consultant|scientist|architect|lead|director|intern|specialist'
+    r'|administrator|designer|officer|coordinator|assistant|associate|technician|programmer|founder|contractor'
+    r'|freelancer?|head of|inc|ltd|llc|corp|gmbh|plc)\b'
+)
+# (heading, education line, employment line) patterns for lowercased text, and for text in any case
+_LINE_PATTERNS = {
+    ignore_case: (re.compile(_HEADING, re.MULTILINE | flags), re.compile(_EDUCATION_LINE, flags),
+                  re.compile(_EMPLOYMENT_LINE, flags))
+    for ignore_case, flags in ((False, 0), (True, re.IGNORECASE))
+}
+
+
+def _line_at(text, offset):
+    start = text.rfind('\n', 0, offset) + 1
+    end = text.find('\n', offset)
+    return text[start:end if end != -1 else len(text)]
+
+
+def employment_spans(text, spans_with_offsets, lowercase=True):
+    """
+    Keeps the date spans that sit on employment entries.
+
+    A span whose line mentions a degree or school is skipped, and one whose line names a job
+    title or company is kept. Any other span counts only under an experience heading.
+
+    Args:
+        text (str): The text the span offsets index into.
+        spans_with_offsets (list): (offset, date span value) tuples.
+        lowercase (bool): Whether text is already lowercased.
+
+    Returns:
+        list: The employment date span values.
+    """
+    heading_pattern, education_pattern, employment_pattern = _LINE_PATTERNS[not lowercase]
+    headings = None  # Found on first use; most spans are settled by their own line
+
+    spans = []
+    for offset, span in spans_with_offsets:
+        line = _line_at(text, offset)
+        if education_pattern.search(line):
+            continue
+        if employment_pattern.search(line):
+            spans.append(span)
+            continue
+        if headings is None:
+            headings = [(m.start(), bool(m.group("employment"))) for m in heading_pattern.finditer(text)]
+        index = bisect.bisect_right(headings, (offset, True)) - 1
+        if index >= 0 and headings[index][1]:
+            spans.append(span)
+    return spans
+
+
+class RuleEngine:
+    def __init__(self, rules=None):
+        """
+        Initializes the RuleEngine by compiling every rule into a single regular expression.
+
+        Matches may only start where no letter or digit precedes them, which lets the scan
+        skip the middle of words cheaply.
+
+        Args:
+            rules (list): (name, pattern, converter) tuples. Defaults to RULES.
+        """
+        self.rules = rules or RULES
+        self.converters = {name: converter for name, _, converter in self.rules}
+        combined = r'(?<![a-z0-9])(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in self.rules) + ')'
+        self.pattern = re.compile(combined)
+        # For text whose lowercase form has a different length, so spans cannot be mapped back
+        self.pattern_ignorecase = re.compile(combined, re.IGNORECASE)
+
+    def scan(self, text, today=None):
+        """
+        Extracts typed values for every rule in a single pass over the text.
+
+        Args:
+            text (str): The text to scan.
+            today (datetime.date): Date used for open-ended spans like "2020 - present". Defaults to today.
+
+        Returns:
+            dict: A list of extracted values for each rule name.
+        """
+        results = {name: [] for name, _, _ in self.rules}
+        for name, _, value in self._scan(text, text.lower(), today or datetime.date.today()):
+            results[name].append(value)
+        return results
+
+    def _scan(self, text, lowered, today):
+        """Yields (rule name, offset, value) for every match."""
+        if len(lowered) == len(text):
+            matches = self.pattern.finditer(lowered)
+        else:
+            matches = self.pattern_ignorecase.finditer(text)
+
+        for match in matches:
+            name = match.lastgroup
+            value = self.converters[name](text[match.start():match.end()], match.groupdict(), today)
+            if value is not None:
+                yield name, match.start(), value
+
+    def extract(self, text, today=None):
+        """
+        Extracts typed experience, certification and contact values from the text.
+
+        Args:
+            text (str): The text to scan.
+            today (datetime.date): Date used for open-ended spans like "2020 - present". Defaults to today.
+
+        Returns:
+            dict: The rule matches, with date_spans limited to employment entries, plus derived values:
+                total_years (float): Years covered by employment date spans, overlaps counted once.
+                experience_years (float): The larger of total_years and the stated years of experience.
+                certification_ids (list): Normalized certification ids, without duplicates.
+        """
+        today = today or datetime.date.today()
+        lowered = text.lower()
+        results = {name: [] for name, _, _ in self.rules}
+        date_spans = []
+        for name, offset, value in self._scan(text, lowered, today):
+            if name == "date_spans":
+                date_spans.append((offset, value))
+            else:
+                results[name].append(value)
+        # Offsets index the lowercased text only when lowering kept its length
+        if len(lowered) == len(text):
+            results["date_spans"] = employment_spans(lowered, date_spans)
+        else:
+            results["date_spans"] = employment_spans(text, date_spans, lowercase=False)
+        results["total_years"] = total_years(results["date_spans"])
+        stated_years = max((e["years"] for e in results["experience"]), default=0)
+        results["experience_years"] = max(float(stated_years), results["total_years"])
+        results["certification_ids"] = list(dict.fromkeys(c["id"] for c in results["certifications"]))
+        return results
+
+
+def total_years(date_spans):
+    """
+    Sums the years covered by date spans, counting overlapping months once.
+
+    Args:
+        date_spans (list): Date span values from RuleEngine.scan().
+
+    Returns:
+        float: Total years, rounded to one decimal.
+    """
+    intervals = sorted((start[0] * 12 + start[1], end[0] * 12 + end[1]) for start, end in
+                       ((span["start"], span["end"]) for span in date_spans))
+    months = 0
+    current_start = current_end = None
+    for start, end in intervals:
+        if current_end is None or start > current_end + 1:
+            if current_end is not None:
+                months += current_end - current_start + 1
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        months += current_end - current_start + 1
+    return round(months / 12, 1)
+
+
+# Shared engine, compiled once at import
+DEFAULT_ENGINE = RuleEngine()
@@ -0,0 +1,235 @@
+import heapq
+import multiprocessing
+import threading
+import zlib
+import numpy as np
+from modules.job_matching.matching import ResumeJobMatcher
+
+
+class ResumeShard:
+    def __init__(self, semantic_weight=0.5):
+        """
+        Initializes a ResumeShard, the partition of resumes owned by one worker process.
+
+        Args:
+            semantic_weight (float): Weight of the embedding similarity in the combined score, between 0 and 1.
+        """
+        self.semantic_weight = semantic_weight
+        self.resume_ids = []
+        self.resume_data = []
+        self.embeddings = []
+        self._matrix = None  # Normalized embeddings, rebuilt after resumes are added
+        self._matrix_rows = None  # Position in resume_ids of each matrix row
+
+    def add(self, resumes):
+        """
+        Adds resumes to the shard.
+
+        Args:
+            resumes (list): (resume_id, resume_data, embedding) tuples; embedding may be None.
+        """
+        for resume_id, resume_data, embedding in resumes:
+            self.resume_ids.append(resume_id)
+            self.resume_data.append(resume_data)
+            self.embeddings.append(None if embedding is None else np.asarray(embedding, dtype=np.float32))
+        self._matrix = None
+
+    def _semantic_scores(self, job_embedding):
+        scores = np.zeros(len(self.resume_ids), dtype=np.float32)
+        if job_embedding is None:
+            return scores
+
+        if self._matrix is None:
+            self._matrix_rows = np.array([i for i, e in enumerate(self.embeddings) if e is not None], dtype=np.int64)
+            if len(self._matrix_rows):
+                matrix = np.vstack([self.embeddings[i] for i in self._matrix_rows])
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                self._matrix = matrix / np.where(norms == 0, 1, norms)
+            else:
+                self._matrix = np.empty((0, 0), dtype=np.float32)
+
+        if len(self._matrix_rows):
+            job_embedding = np.asarray(job_embedding, dtype=np.float32)
+            job_norm = np.linalg.norm(job_embedding)
+            if job_norm:
+                scores[self._matrix_rows] = np.clip(self._matrix @ (job_embedding / job_norm), 0, 1)
+        return scores
+
+    def query(self, job_data, job_embedding=None, top_k=10):
+        """
+        Scores every resume in the shard against a job and returns the best ones.
+
+        The combined score blends the structured total_match_score with the cosine
+        similarity of the embeddings (scaled to 0-100) using semantic_weight. Without a
+        job embedding only the structured score is used.
+
+        Args:
+            job_data (dict): Parsed job description data.
+            job_embedding (array-like): Embedding of the job description, or None.
+            top_k (int): Number of results to return.
+
+        Returns:
+            list: Up to top_k result dicts, best first.
+        """
+        semantic_scores = self._semantic_scores(job_embedding)
+        weight = self.semantic_weight if job_embedding is not None else 0.0
+
+        results = []
+        for resume_id, resume_data, semantic_score in zip(self.resume_ids, self.resume_data, semantic_scores):
+            match = ResumeJobMatcher(resume_data, job_data).calculate_total_match_score()
+            score = (1 - weight) * match["total_match_score"] + weight * float(semantic_score) * 100
+            results.append({
+                "resume_id": resume_id,
+                "score": score,
+                "semantic_score": float(semantic_score),
+                "match": match,
+            })
+        return heapq.nlargest(top_k, results, key=lambda result: result["score"])
+
+    def __len__(self):
+        return len(self.resume_ids)
+
+
+def _run_shard(connection, semantic_weight):
+    """Serves commands for one ResumeShard until told to stop."""
+    shard = ResumeShard(semantic_weight)
+    while True:
+        command, payload = connection.recv()
+        try:
+            if command == "add":
+                shard.add(payload)
+                connection.send(("ok", len(shard)))
+            elif command == "query":
+                connection.send(("ok", shard.query(*payload)))
+            elif command == "count":
+                connection.send(("ok", len(shard)))
+            elif command == "stop":
+                connection.send(("ok", None))
+                break
+            else:
+                raise ValueError(f"Unknown shard command: {command}")
+        except Exception as e:
+            connection.send(("error", repr(e)))
+    connection.close()
+
+
+class ShardedMatcher:
+    def __init__(self, num_shards=4, semantic_weight=0.5):
+        """
+        Initializes the ShardedMatcher and starts one worker process per shard.
+
+        Args:
+            num_shards (int): Number of shard processes.
+            semantic_weight (float): Weight of the embedding similarity in the combined score, between 0 and 1.
+        """
+        self.num_shards = num_shards
+        self.connections = []
+        self.processes = []
+        self._lock = threading.Lock()  # One scatter-gather round at a time over the pipes
+
+        for _ in range(num_shards):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_run_shard, args=(child_connection, semantic_weight), daemon=True)
+            process.start()
+            child_connection.close()
+            self.connections.append(parent_connection)
+            self.processes.append(process)
+
+    def shard_for(self, resume_id):
+        """
+        Returns the shard that owns a resume.
+
+        Args:
+            resume_id (str): Identifier of the resume.
+
+        Returns:
+            int: Index of the shard.
+        """
+        return zlib.crc32(str(resume_id).encode('utf-8')) % self.num_shards
+
+    def _scatter(self, messages):
+        """
+        Sends one message per shard, then collects every reply.
+
+        Every reply is read before any shard error is raised, so the pipes stay in step for the next round.
+        """
+        with self._lock:
+            for shard, message in messages.items():
+                self.connections[shard].send(message)
+            replies = {}
+            errors = []
+            for shard in messages:
+                status, payload = self.connections[shard].recv()
+                if status == "error":
+                    errors.append(f"Shard {shard} failed: {payload}")
+                else:
+                    replies[shard] = payload
+            if errors:
+                raise RuntimeError("; ".join(errors))
+            return replies
+
+    def add_resumes(self, resumes):
+        """
+        Adds resumes, sending each shard its partition in a single batch.
+
+        Args:
+            resumes (iterable): (resume_id, resume_data, embedding) tuples, where resume_data is the
+                output of ResumeParser.summarize() and embedding may be None.
+        """
+        partitions = {}
+        for resume_id, resume_data, embedding in resumes:
+            partitions.setdefault(self.shard_for(resume_id), []).append((resume_id, resume_data, embedding))
+        self._scatter({shard: ("add", batch) for shard, batch in partitions.items()})
+
+    def add_resume(self, resume_id, resume_data, embedding=None):
+        """
+        Adds a single resume.
+
+        Args:
+            resume_id (str): Identifier of the resume.
+            resume_data (dict): Output of ResumeParser.summarize().
+            embedding (array-like): Embedding of the resume text, or None.
+        """
+        self.add_resumes([(resume_id, resume_data, embedding)])
+
+    def query(self, job_data, job_embedding=None, top_k=10):
+        """
+        Fans a job out to every shard and merges their top results.
+
+        Args:
+            job_data (dict): Output of JobDescriptionParser.summarize().
+            job_embedding (array-like): Embedding of the job description, or None.
+            top_k (int): Number of results to return.
+
+        Returns:
+            list: Up to top_k result dicts with resume_id, score, semantic_score and the match breakdown, best first.
+        """
+        payload = (job_data, job_embedding, top_k)
+        replies = self._scatter({shard: ("query", payload) for shard in range(self.num_shards)})
+        return heapq.nlargest(top_k, (r for results in replies.values() for r in results), key=lambda r: r["score"])
+
+    def __len__(self):
+        replies = self._scatter({shard: ("count", None) for shard in range(self.num_shards)})
+        return sum(replies.values())
+
+    def close(self):
+        """Stops every shard process."""
+        if not self.processes:
+            return
+        try:
+            self._scatter({shard: ("stop", None) for shard in range(self.num_shards)})
+        finally:
+            for process in self.processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for connection in self.connections:
+                connection.close()
+            self.processes = []
+            self.connections = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
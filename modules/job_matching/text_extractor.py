@@ -1,6 +1,19 @@
 import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
 from PyPDF2 import PdfReader
-from docx import Document
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+FALLBACK_TAG = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# Text equivalents of run content other than w:t, matching python-docx
+RUN_CONTENT_TEXT = {
+    WORD_NAMESPACE + 'tab': '\t',
+    WORD_NAMESPACE + 'ptab': '\t',
+    WORD_NAMESPACE + 'cr': '\n',
+    WORD_NAMESPACE + 'noBreakHyphen': '-',
+}
 
 def extract_text_from_file(file_path):
     file_extension = os.path.splitext(file_path)[1].lower()
@@ -22,6 +35,83 @@ def extract_text_from_pdf(file_path):
         text += page.extract_text()
     return text
 
+def _docx_parts(archive):
+    """Returns the XML parts holding text, in reading order: headers, body, footers."""
+    def part_number(name):
+        return int(re.sub(r'\D', '', os.path.basename(name)) or 0)
+
+    names = archive.namelist()
+    headers = sorted((n for n in names if re.fullmatch(r'word/header\d*\.xml', n)), key=part_number)
+    footers = sorted((n for n in names if re.fullmatch(r'word/footer\d*\.xml', n)), key=part_number)
+    return headers + ['word/document.xml'] + footers
+
+def _iter_part_paragraphs(stream):
+    """Incrementally parses one WordprocessingML part and yields the text of each paragraph."""
+    # (text, nested paragraph texts) of each open paragraph. Text boxes nest paragraphs inside runs;
+    # they are held back until the enclosing paragraph closes so they follow it in reading order.
+    paragraphs = []
+    run_depth = 0
+    fallback_depth = 0  # Inside mc:Fallback, which repeats content already given in mc:Choice
+    container = None
+
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == FALLBACK_TAG:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == WORD_NAMESPACE + 'p':
+                paragraphs.append(([], []))
+            elif tag == WORD_NAMESPACE + 'r':
+                run_depth += 1
+            elif tag in (WORD_NAMESPACE + 'body', WORD_NAMESPACE + 'hdr', WORD_NAMESPACE + 'ftr'):
+                container = elem
+            continue
+
+        if tag == FALLBACK_TAG:
+            fallback_depth -= 1
+        elif fallback_depth:
+            continue
+        elif tag == WORD_NAMESPACE + 'p':
+            text, nested = paragraphs.pop()
+            if paragraphs:
+                paragraphs[-1][1].append(''.join(text))
+                paragraphs[-1][1].extend(nested)
+                continue
+            yield ''.join(text)
+            yield from nested
+            if container is not None:
+                container.clear()  # Drop parsed content so memory stays flat
+        elif tag == WORD_NAMESPACE + 'r':
+            run_depth -= 1
+        elif run_depth and paragraphs:
+            if tag == WORD_NAMESPACE + 't':
+                paragraphs[-1][0].append(elem.text or '')
+            elif tag == WORD_NAMESPACE + 'br':
+                if elem.get(WORD_NAMESPACE + 'type', 'textWrapping') == 'textWrapping':
+                    paragraphs[-1][0].append('\n')
+            elif tag in RUN_CONTENT_TEXT:
+                paragraphs[-1][0].append(RUN_CONTENT_TEXT[tag])
+
+def iter_docx_text(file_path):
+    """
+    Streams the paragraphs of a .docx file in reading order.
+
+    The XML parts are parsed incrementally straight from the zip archive, so the whole
+    document is never held in memory. Headers come first, then the body (including table
+    cells and text boxes), then footers.
+
+    Args:
+        file_path (str): Path to the .docx file.
+
+    Yields:
+        str: The text of each paragraph.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        for part in _docx_parts(archive):
+            with archive.open(part) as stream:
+                yield from _iter_part_paragraphs(stream)
+
 def extract_text_from_docx(file_path):
-    doc = Document(file_path)
-    return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+    return '\n'.join(iter_docx_text(file_path))
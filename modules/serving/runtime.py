@@ -0,0 +1,270 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, message, status_code, retry_after=None):
+        """
+        Raised when a request cannot be admitted.
+
+        Args:
+            message (str): Reason shown to the client.
+            status_code (int): HTTP status to answer with (429 when saturated, 503 when draining).
+            retry_after (int): Seconds the client should wait before retrying, if known.
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class StageTimeout(Exception):
+    def __init__(self, stage, timeout, future=None):
+        """
+        Raised when a pipeline stage does not finish within its time limit.
+
+        Args:
+            stage (str): Name of the stage that timed out.
+            timeout (float): The time limit in seconds.
+            future (concurrent.futures.Future): The abandoned work, which may still be running.
+        """
+        super().__init__(f"Stage '{stage}' did not finish within {timeout} seconds.")
+        self.stage = stage
+        self.timeout = timeout
+        self.future = future
+
+
+class AdmissionController:
+    def __init__(self, max_in_flight=4, max_queued=8, queue_timeout=10.0):
+        """
+        Initializes the AdmissionController.
+
+        Args:
+            max_in_flight (int): Number of requests allowed to run at once.
+            max_queued (int): Number of requests allowed to wait for a free slot.
+            queue_timeout (float): Seconds a queued request waits before it is rejected.
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.draining = False
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Admits a request, waiting in the queue if every slot is busy.
+
+        Raises:
+            AdmissionRejected: 503 while draining, 429 if the queue is full or the wait times out.
+        """
+        with self._condition:
+            if self.draining:
+                raise AdmissionRejected("Server is shutting down.", 503)
+            if self.in_flight >= self.max_in_flight and self.queued >= self.max_queued:
+                raise AdmissionRejected("Server is busy, try again later.", 429, retry_after=int(self.queue_timeout))
+
+            self.queued += 1
+            try:
+                admitted = self._condition.wait_for(
+                    lambda: self.draining or self.in_flight < self.max_in_flight, timeout=self.queue_timeout
+                )
+            finally:
+                self.queued -= 1
+
+            if self.draining:
+                raise AdmissionRejected("Server is shutting down.", 503)
+            if not admitted:
+                raise AdmissionRejected("Server is busy, try again later.", 429, retry_after=int(self.queue_timeout))
+            self.in_flight += 1
+
+    def release(self):
+        """Frees the slot held by a finished request."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def release_after(self, future):
+        """
+        Frees the slot once the future finishes, so abandoned work still counts against the limit.
+
+        Args:
+            future (concurrent.futures.Future): Work started by the request.
+        """
+        future.add_done_callback(lambda _: self.release())
+
+    def drain(self, timeout=None):
+        """
+        Stops admitting requests and waits for in-flight ones to finish.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if every in-flight request finished, False if the wait timed out.
+        """
+        with self._condition:
+            self.draining = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self.in_flight == 0, timeout=timeout)
+
+
+class StageRunner:
+    def __init__(self, stages):
+        """
+        Initializes the StageRunner with one bounded executor per stage.
+
+        Args:
+            stages (dict): Maps a stage name to a (max_workers, timeout) or (max_workers, timeout, max_queued)
+                tuple. max_queued defaults to max_workers.
+        """
+        self.timeouts = {}
+        self.executors = {}
+        self.slots = {}  # stage -> semaphore bounding its running and queued work
+        for name, (max_workers, timeout, *max_queued) in stages.items():
+            self.timeouts[name] = timeout
+            self.executors[name] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"stage-{name}")
+            self.slots[name] = threading.BoundedSemaphore(max_workers + (max_queued[0] if max_queued else max_workers))
+
+    def submit(self, stage, func, *args, **kwargs):
+        """
+        Submits a function to the stage's executor without waiting for it.
+
+        Args:
+            stage (str): Name of the stage.
+            func (callable): The work to run.
+
+        Returns:
+            concurrent.futures.Future: The submitted work.
+
+        Raises:
+            AdmissionRejected: 429 if the stage already has as much running and queued work as it allows.
+        """
+        slots = self.slots[stage]
+        if not slots.acquire(blocking=False):
+            raise AdmissionRejected(f"Stage '{stage}' is busy, try again later.", 429,
+                                    retry_after=int(self.timeouts[stage]))
+        try:
+            future = self.executors[stage].submit(func, *args, **kwargs)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def run(self, stage, func, *args, cancel_event=None, **kwargs):
+        """
+        Runs a function on the stage's executor and waits for its result.
+
+        A stage that times out is cancelled if it has not started yet. Work that is
+        already running cannot be interrupted; cancel_event is set so work that checks
+        it can stop early, and the abandoned future is attached to the StageTimeout so
+        the caller can hold on to resources until it finishes.
+
+        Args:
+            stage (str): Name of the stage.
+            func (callable): The work to run.
+            cancel_event (threading.Event): Set when the stage times out.
+
+        Returns:
+            The return value of func.
+
+        Raises:
+            StageTimeout: If the stage does not finish within its time limit.
+            AdmissionRejected: If the stage's queue is full.
+        """
+        future = self.submit(stage, func, *args, **kwargs)
+        timeout = self.timeouts[stage]
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            if cancel_event is not None:
+                cancel_event.set()
+            raise StageTimeout(stage, timeout, future)
+
+    def stream(self, stage, func, *args, cancel_event=None, max_buffered=16, **kwargs):
+        """
+        Runs a generator function on the stage's executor and passes its items back through a bounded queue.
+
+        The stage's time limit covers the whole stream. If it runs out, or the consumer stops reading,
+        cancel_event is set and the producer stops at its next item.
+
+        Args:
+            stage (str): Name of the stage.
+            func (callable): A generator function, or any function returning an iterator.
+            cancel_event (threading.Event): Set when the stream times out or is abandoned. Created if None.
+            max_buffered (int): Items the producer may run ahead of the consumer.
+
+        Returns:
+            tuple: (future, items), where future finishes once the producer has stopped and items is
+                a generator over func's items.
+
+        Raises:
+            AdmissionRejected: If the stage's queue is full.
+        """
+        cancel_event = cancel_event or threading.Event()
+        items = queue.Queue(maxsize=max_buffered)
+
+        def put(message):
+            # Blocks while the consumer is behind, giving up once the stream is cancelled
+            while not cancel_event.is_set():
+                try:
+                    items.put(message, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            generator = None
+            try:
+                # Creating the generator may itself fail, e.g. while loading models
+                generator = func(*args, **kwargs)
+                for item in generator:
+                    if not put(("item", item)):
+                        return
+                put(("done", None))
+            except Exception as e:
+                put(("error", e))
+            finally:
+                if generator is not None and hasattr(generator, "close"):
+                    generator.close()
+
+        future = self.submit(stage, produce)
+        timeout = self.timeouts[stage]
+
+        def consume():
+            deadline = time.monotonic() + timeout
+            finished = False
+            try:
+                while True:
+                    try:
+                        kind, item = items.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        future.cancel()
+                        raise StageTimeout(stage, timeout, future)
+                    if kind == "item":
+                        yield item
+                    else:
+                        finished = True
+                        if kind == "error":
+                            raise item
+                        return
+            finally:
+                if not finished:
+                    cancel_event.set()
+
+        return future, consume()
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down every stage executor.
+
+        Args:
+            wait (bool): Whether to wait for running stages to finish.
+        """
+        for executor in self.executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,57 @@
+import argparse
+import signal
+import threading
+from werkzeug.serving import make_server
+from app import app, admission, stage_runner, match_store, logger
+
+
+def main():
+    """Runs the app on a threaded WSGI server that drains in-flight work on shutdown."""
+    parser = argparse.ArgumentParser(description="Production server for the interview analysis and job matching app.")
+    parser.add_argument("--host", default="0.0.0.0", help="Address to bind to.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    parser.add_argument("--drain-timeout", type=float, default=60.0,
+                        help="Seconds to wait for in-flight requests on shutdown.")
+    parser.add_argument("--compact-every", type=float, default=24.0,
+                        help="Hours between compactions of the match analytics dataset, or 0 to disable.")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, app, threaded=True)
+    stop_compaction = threading.Event()
+
+    def compact_analytics():
+        # The app writes small batches, so merge each finished day into one file to keep dashboard queries fast
+        while True:
+            try:
+                match_store.compact()
+            except Exception as e:
+                logger.error(f"Analytics compaction failed: {e}")
+            if stop_compaction.wait(args.compact_every * 3600):
+                return
+
+    def shutdown():
+        logger.info("Shutting down, draining in-flight requests")
+        stop_compaction.set()
+        if not admission.drain(timeout=args.drain_timeout):
+            logger.warning(f"{admission.in_flight} requests still running after {args.drain_timeout} seconds")
+        server.shutdown()
+
+    def handle_signal(signum, frame):
+        # serve_forever() runs on this thread, so shut down from another one
+        threading.Thread(target=shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    if args.compact_every > 0:
+        threading.Thread(target=compact_analytics, daemon=True).start()
+
+    logger.info(f"Serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    finally:
+        stage_runner.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    main()
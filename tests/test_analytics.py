@@ -0,0 +1,135 @@
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from modules.job_matching.analytics import MatchAnalyticsStore
+from modules.job_matching.matching import ResumeJobMatcher
+
+class TestMatchAnalyticsStore(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a store with matches for two jobs over two days.
+        """
+        self.root = tempfile.mkdtemp()
+        self.store = MatchAnalyticsStore(self.root, batch_size=3)
+        self.job_data = {"skills": ["Python", "SQL", "Docker"], "education": ["master's"],
+                         "certifications": [], "experience": ["3+ years of experience"]}
+        self.other_job_data = {"skills": ["Java"], "education": [], "certifications": [], "experience": []}
+        self.day_one = datetime.datetime(2024, 5, 1, 9, 0)
+        self.day_two = datetime.datetime(2024, 5, 2, 9, 0)
+
+        resumes = {
+            "alice": {"skills": ["Python", "SQL", "Docker"], "education": ["master's"], "certifications": [],
+                      "experience": ["5+ years of experience"]},
+            "bob": {"skills": ["Python"], "education": [], "certifications": [], "experience": []},
+            "carol": {"skills": ["SQL", "Java"], "education": ["master's"], "certifications": [],
+                      "experience": ["4+ years of experience"]},
+        }
+        for timestamp in (self.day_one, self.day_two):
+            for resume_id, resume_data in resumes.items():
+                self.add(resume_id, "data-scientist", resume_data, self.job_data, timestamp)
+        self.add("carol", "java-dev", resumes["carol"], self.other_job_data, self.day_one)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def count_files(self):
+        return sum(len(files) for _, _, files in os.walk(self.root))
+
+    def add(self, resume_id, job_id, resume_data, job_data, timestamp):
+        match = ResumeJobMatcher(resume_data, job_data).calculate_total_match_score()
+        self.store.append(resume_id, job_id, resume_data, job_data, match, timestamp)
+
+    def test_skill_gap_distribution(self):
+        """
+        Test that missing skills are counted per job.
+        """
+        gaps = self.store.skill_gap_distribution("data-scientist")
+        self.assertEqual(gaps["Docker"], {"missing": 4, "fraction": 4 / 6})
+        self.assertEqual(gaps["SQL"]["missing"], 2)
+        self.assertEqual(gaps["Python"]["missing"], 2)
+        self.assertEqual(self.store.skill_gap_distribution("unknown-job"), {})
+
+    def test_score_histogram(self):
+        """
+        Test that every match lands in one histogram bin.
+        """
+        histogram = self.store.score_histogram(bins=4)
+        self.assertEqual(len(histogram), 4)
+        self.assertEqual(sum(b["count"] for b in histogram), 7)
+        self.assertEqual(sum(b["count"] for b in self.store.score_histogram("java-dev", bins=4)), 1)
+
+    def test_top_candidates(self):
+        """
+        Test that candidates are ranked by their best score.
+        """
+        top = self.store.top_candidates("data-scientist", limit=2)
+        self.assertEqual([c["resume_id"] for c in top], ["alice", "carol"])
+        self.assertEqual(top[0]["matches"], 2)
+
+    def test_time_range(self):
+        """
+        Test that queries only read matches inside the time range.
+        """
+        start = datetime.datetime(2024, 5, 2)
+        histogram = self.store.score_histogram("data-scientist", start=start)
+        self.assertEqual(sum(b["count"] for b in histogram), 3)
+        end = datetime.datetime(2024, 5, 1, 12, 0)
+        candidates = self.store.top_candidates(end=end, limit=10)
+        self.assertEqual(sum(c["matches"] for c in candidates), 4)
+
+    def test_buffered_rows_are_queryable(self):
+        """
+        Test that rows still in the write buffer are included in queries without being written out.
+        """
+        files_before = self.count_files()
+        self.assertEqual(len(self.store.buffer), 1)
+        self.assertEqual(len(self.store.top_candidates("java-dev")), 1)
+        self.assertEqual(self.store.top_candidates("java-dev", start=datetime.datetime(2024, 5, 2)), [])
+        self.assertEqual(sum(b["count"] for b in self.store.score_histogram(bins=4)), 7)
+        self.assertEqual(len(self.store.buffer), 1)
+        self.assertEqual(self.count_files(), files_before)
+
+    def test_compact(self):
+        """
+        Test that compacting leaves one file per day and the same query results.
+        """
+        self.store.flush()
+        before = self.store.top_candidates(limit=10)
+        self.store.compact(before=datetime.date(2024, 5, 3))
+        for day in ("2024-05-01", "2024-05-02"):
+            self.assertEqual(len(os.listdir(os.path.join(self.root, f"match_date={day}"))), 1)
+        self.assertEqual(self.store.top_candidates(limit=10), before)
+
+    def test_queries_during_compaction(self):
+        """
+        Test that queries running while days are compacted see every row exactly once.
+        """
+        resume_data = {"skills": ["Python"], "education": [], "certifications": [], "experience": []}
+        for day in range(3, 13):
+            for hour in range(30):
+                self.add(f"resume-{hour}", "data-scientist", resume_data, self.job_data,
+                         datetime.datetime(2024, 5, day) + datetime.timedelta(minutes=hour))
+        self.store.flush()
+        expected = 7 + 10 * 30
+
+        counts = []
+        done = threading.Event()
+        def query():
+            while not done.is_set():
+                counts.append(sum(b["count"] for b in self.store.score_histogram(bins=2)))
+        thread = threading.Thread(target=query)
+        thread.start()
+        self.store.compact(before=datetime.date(2024, 5, 13))
+        done.set()
+        thread.join()
+
+        self.assertTrue(counts)
+        self.assertEqual(set(counts), {expected})
+        self.assertEqual(self.count_files(), 12)
+
+if __name__ == '__main__':
+    unittest.main()
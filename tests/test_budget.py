@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+import wave
+import numpy as np
+from modules.interview_analyzer.budget import BudgetExceeded, PooledEmbedding, ResourceBudget, iter_audio_windows
+
+def write_wav(path, seconds, framerate=8000):
+    """Writes a mono 16-bit WAV of the given length one second at a time."""
+    second = (np.arange(framerate, dtype=np.int16) % 128).tobytes()
+    with wave.open(path, 'wb') as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(framerate)
+        for _ in range(int(seconds)):
+            audio.writeframes(second)
+        audio.writeframes(second[:int((seconds % 1) * framerate) * 2])
+
+def peak_memory(audio_path, budget):
+    """Runs the windowed pipeline over the audio, returning its peak traced allocation in bytes."""
+    tracemalloc.start()
+    try:
+        pooled = PooledEmbedding(4)
+        for start, end, audio_data in iter_audio_windows(audio_path, budget.max_audio_seconds):
+            samples = np.frombuffer(audio_data.frame_data, dtype=np.int16)
+            pooled.add([[samples.mean(), samples.max(), start, end]], [end - start])
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+class TestResourceBudget(unittest.TestCase):
+
+    def test_memory_cap(self):
+        """
+        Test that going over the resident memory cap raises a clear error naming the stage.
+        """
+        with self.assertRaises(BudgetExceeded) as context:
+            ResourceBudget(max_rss_bytes=1024 * 1024).check_memory("transcription")
+        self.assertEqual(context.exception.resource, "memory")
+        self.assertIn("memory budget during transcription", str(context.exception))
+        self.assertIn("limit is 1 MB", str(context.exception))
+        ResourceBudget().check_memory("transcription")  # No cap by default
+
+    def test_invalid_caps(self):
+        """
+        Test that caps that cannot be kept are rejected up front.
+        """
+        with self.assertRaises(ValueError):
+            ResourceBudget(max_audio_seconds=0)
+        with self.assertRaises(ValueError):
+            ResourceBudget(summary_batch_size=1)
+
+class TestWindowedPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_windows_cover_the_audio(self):
+        """
+        Test that windows are capped in length and no frames are lost between them.
+        """
+        path = os.path.join(self.temp_dir, "audio.wav")
+        write_wav(path, 10.5)
+        windows = list(iter_audio_windows(path, 4))
+        self.assertEqual([(start, end) for start, end, _ in windows], [(0.0, 4.0), (4.0, 8.0), (8.0, 10.5)])
+        self.assertEqual(sum(len(audio_data.frame_data) for _, _, audio_data in windows), 10.5 * 8000 * 2)
+
+    def test_peak_memory_is_flat(self):
+        """
+        Test that peak memory does not grow with the length of the audio.
+        """
+        budget = ResourceBudget(max_audio_seconds=30)
+        peaks = []
+        for minutes in (2, 16):
+            path = os.path.join(self.temp_dir, f"{minutes}.wav")
+            write_wav(path, minutes * 60)
+            peaks.append(peak_memory(path, budget))
+            os.remove(path)
+
+        window_bytes = 30 * 8000 * 2
+        self.assertLess(peaks[1], peaks[0] * 1.2)
+        self.assertLess(peaks[1], 4 * window_bytes)  # The 16 minute file is 32 windows
+
+class TestPooledEmbedding(unittest.TestCase):
+
+    def test_weighted_mean(self):
+        """
+        Test that batches pool to the unit-length weighted mean of all chunk embeddings.
+        """
+        pooled = PooledEmbedding(2)
+        self.assertIsNone(pooled.value())
+        pooled.add([[1.0, 0.0]], [3])
+        pooled.add([[0.0, 1.0], [0.0, 1.0]], [1, 2])
+        np.testing.assert_allclose(pooled.value(), [np.sqrt(0.5), np.sqrt(0.5)], rtol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
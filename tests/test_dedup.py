@@ -0,0 +1,100 @@
+import unittest
+from modules.job_matching.dedup import ResumeDeduplicator
+
+class TestResumeDeduplicator(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a deduplicator and a few sample resumes.
+        """
+        self.resume_text = """
+        John Doe
+        Email: johndoe@example.com
+        Phone: (123) 456-7890
+        Experienced Software Engineer with 7+ years of experience in Python, Java, and cloud technologies.
+        Led the migration of a monolithic billing platform to microservices running on Kubernetes.
+        Built data pipelines in Python and SQL that process millions of events per day.
+        Mentored junior engineers and ran weekly design reviews for the platform team.
+        Bachelor's degree in Computer Science.
+        Certifications: AWS Certified Solutions Architect, PMP.
+        Skills: Python, Java, Cloud Computing, Team Leadership, Agile Development.
+        """
+        # Same resume resubmitted with a different phone number
+        self.resubmitted_text = self.resume_text.replace("(123) 456-7890", "(987) 654-3210")
+        self.other_text = """
+        Jane Smith
+        Graphic designer with a background in print and brand identity for retail clients.
+        Produced packaging, catalogues and in-store signage for national campaigns.
+        Proficient in Illustrator, InDesign and Photoshop.
+        Associate degree in Visual Communication.
+        """
+        self.deduplicator = ResumeDeduplicator()
+
+    def test_identical_signatures(self):
+        """
+        Test that the same text always produces the same signature.
+        """
+        signature_a = self.deduplicator.signature(self.resume_text)
+        signature_b = self.deduplicator.signature(self.resume_text)
+        self.assertEqual(self.deduplicator.similarity(signature_a, signature_b), 1.0)
+
+    def test_add_near_duplicate(self):
+        """
+        Test that a near-duplicate resume is collapsed onto the original.
+        """
+        self.assertIsNone(self.deduplicator.add("john.pdf", self.resume_text))
+        self.assertEqual(self.deduplicator.add("john_v2.pdf", self.resubmitted_text), "john.pdf")
+        self.assertEqual(self.deduplicator.canonical_id("john_v2.pdf"), "john.pdf")
+        self.assertEqual(len(self.deduplicator), 1)
+
+    def test_add_distinct_resume(self):
+        """
+        Test that unrelated resumes are both indexed.
+        """
+        self.assertIsNone(self.deduplicator.add("john.pdf", self.resume_text))
+        self.assertIsNone(self.deduplicator.add("jane.pdf", self.other_text))
+        self.assertEqual(len(self.deduplicator), 2)
+        self.assertEqual(self.deduplicator.query(self.other_text)[0][0], "jane.pdf")
+
+    def test_remove(self):
+        """
+        Test that removing a resume drops it and its duplicates from the index.
+        """
+        self.deduplicator.add("john.pdf", self.resume_text)
+        self.deduplicator.add("john_v2.pdf", self.resubmitted_text)
+        self.deduplicator.remove("john.pdf")
+        self.assertEqual(len(self.deduplicator), 0)
+        self.assertEqual(self.deduplicator.query(self.resume_text), [])
+        self.assertEqual(self.deduplicator.canonical_id("john_v2.pdf"), "john_v2.pdf")
+
+    def test_resubmission_under_same_name(self):
+        """
+        Test that re-adding a resume under its own name is reported as a duplicate of itself.
+        """
+        self.assertIsNone(self.deduplicator.add("john.pdf", self.resume_text))
+        self.assertEqual(self.deduplicator.add("john.pdf", self.resubmitted_text), "john.pdf")
+        self.assertIsNone(self.deduplicator.add("john.pdf", self.other_text))
+        self.assertEqual(self.deduplicator.query(self.resume_text), [])
+
+    def test_max_documents(self):
+        """
+        Test that the least recently matched resume is evicted once the index is full.
+        """
+        deduplicator = ResumeDeduplicator(max_documents=2)
+        deduplicator.add("john.pdf", self.resume_text)
+        deduplicator.add("jane.pdf", self.other_text)
+        deduplicator.add("john_v2.pdf", self.resubmitted_text)  # Marks john.pdf as recently matched
+        deduplicator.add("third.pdf", "A completely different resume about welding and metal fabrication work.")
+        self.assertEqual(len(deduplicator), 2)
+        self.assertEqual(deduplicator.query(self.other_text), [])
+        self.assertEqual(deduplicator.query(self.resume_text)[0][0], "john.pdf")
+
+    def test_invalid_bands(self):
+        """
+        Test that a band count that does not divide the permutations is rejected.
+        """
+        with self.assertRaises(ValueError):
+            ResumeDeduplicator(num_perm=128, bands=30)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+from modules.job_matching.incremental import IncrementalMatcher
+from modules.job_matching.matching import ResumeJobMatcher
+
+RESUMES = {
+    "alice": ("Data scientist with Python, SQL and Machine Learning. 5+ years of experience.",
+              {"education": ["master's"], "certifications": [], "experience": ["5+ years of experience"]}),
+    "bob": ("Backend developer working in Java and Docker. 2+ years of experience.",
+            {"education": ["bachelor's"], "certifications": [], "experience": ["2+ years of experience"]}),
+    "carol": ("ML engineer: Deep Learning, Python, Docker. 4+ years of experience.",
+              {"education": ["master's"], "certifications": [], "experience": ["4+ years of experience"]}),
+}
+JOBS = {
+    "data": ("Looking for Python and SQL skills. 3+ years of experience.",
+             {"education": ["master's"], "certifications": [], "experience": ["3+ years of experience"]}),
+    "platform": ("Docker and Java engineer. 1+ years of experience.",
+                 {"education": ["bachelor's"], "certifications": [], "experience": ["1+ years of experience"]}),
+}
+
+def build(skills, weights=None):
+    matcher = IncrementalMatcher(skills, weights)
+    for job_id, (text, data) in JOBS.items():
+        matcher.add_job(job_id, text, data)
+    matcher.add_resumes((resume_id, text, data) for resume_id, (text, data) in RESUMES.items())
+    return matcher
+
+class TestIncrementalMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.skills = ["Python", "SQL", "Java"]
+        self.matcher = build(self.skills)
+
+    def assertSameScores(self, matcher, expected):
+        for pair in expected.totals:
+            self.assertEqual(matcher.scores(*pair), expected.scores(*pair))
+
+    def test_scores_match_resume_job_matcher(self):
+        """
+        Test that materialized scores equal a direct ResumeJobMatcher computation.
+        """
+        resume_data = dict(RESUMES["alice"][1], skills=["Python", "SQL"])
+        job_data = dict(JOBS["data"][1], skills=["Python", "SQL"])
+        expected = ResumeJobMatcher(resume_data, job_data).calculate_total_match_score()
+        self.assertEqual(self.matcher.scores("alice", "data"), expected)
+
+    def test_add_skill(self):
+        """
+        Test that adding a skill rescores only the skill component of affected pairs.
+        """
+        self.matcher.components_computed = 0
+        self.matcher.set_skills(self.skills + ["Docker"])
+        self.assertSameScores(self.matcher, build(self.skills + ["Docker"]))
+        # Docker appears in bob, carol and the platform job, so alice/data is untouched
+        self.assertEqual(self.matcher.components_computed, 5)
+
+    def test_remove_skill(self):
+        """
+        Test that removing a skill matches a full recompute.
+        """
+        self.matcher.set_skills(["Python", "Java"])
+        self.assertSameScores(self.matcher, build(["Python", "Java"]))
+
+    def test_set_weights(self):
+        """
+        Test that changing weights recomputes totals without recomputing components.
+        """
+        weights = {"skill_match": 1, "education_match": 3, "certification_match": 0, "experience_match": 1}
+        self.matcher.components_computed = 0
+        self.matcher.set_weights(weights)
+        self.assertSameScores(self.matcher, build(self.skills, weights))
+        self.assertEqual(self.matcher.components_computed, 0)
+
+    def test_update_job_requirements(self):
+        """
+        Test that editing a job's requirements rescores only the changed component for that job.
+        """
+        new_data = dict(JOBS["data"][1], experience=["5+ years of experience"])
+        self.matcher.components_computed = 0
+        self.matcher.update_job("data", job_data=new_data)
+        self.assertEqual(self.matcher.components_computed, len(RESUMES))
+        self.assertFalse(self.matcher.scores("carol", "data")["experience_match"])
+        self.assertTrue(self.matcher.scores("alice", "data")["experience_match"])
+
+    def test_readd_resume_replaces_skills(self):
+        """
+        Test that adding a resume again under the same id drops the skills of the earlier text.
+        """
+        self.matcher.add_resume("alice", "Python Java", RESUMES["alice"][1])
+        self.matcher.add_resume("alice", "nothing here", RESUMES["alice"][1])
+        self.assertEqual(self.matcher.data["resume"]["alice"]["skills"], [])
+        self.assertEqual(self.matcher.scores("alice", "data")["skill_match"], 0)
+
+    def test_update_resume(self):
+        """
+        Test that editing a resume rescores only the changed component and matches a full recompute.
+        """
+        text = "Backend developer working in Python and SQL. 5+ years of experience."
+        data = dict(RESUMES["bob"][1], experience=["5+ years of experience"])
+        self.matcher.components_computed = 0
+        entries = self.matcher.update_resume("bob", resume_text=text, resume_data=data)
+        self.assertEqual(self.matcher.components_computed, 2 * len(JOBS))  # Skills and experience
+        self.assertEqual(self.matcher.data["resume"]["bob"]["skills"], ["Python", "SQL"])
+
+        expected = IncrementalMatcher(self.skills)
+        for job_id, (job_text, job_data) in JOBS.items():
+            expected.add_job(job_id, job_text, job_data)
+        expected.add_resumes((resume_id, resume_text, resume_data) for resume_id, (resume_text, resume_data)
+                             in dict(RESUMES, bob=(text, data)).items())
+        self.assertSameScores(self.matcher, expected)
+        for job_id in JOBS:
+            self.assertEqual(self.matcher.ranking(job_id), expected.ranking(job_id))
+        # Only the rescored pairs are logged, not the resumes they pushed down
+        self.assertEqual(entries, [{"reason": "updated resume bob", "job_id": "data", "moves": [("bob", 3, 2)]}])
+
+    def test_remove_resume(self):
+        """
+        Test that a removed resume leaves every ranking, score and posting.
+        """
+        old_rank = [resume_id for resume_id, _ in self.matcher.ranking("platform")].index("bob") + 1
+        entries = self.matcher.remove_resume("bob")
+        self.assertIn({"reason": "removed resume bob", "job_id": "platform", "moves": [("bob", old_rank, None)]},
+                      entries)
+        for job_id in JOBS:
+            self.assertNotIn("bob", [resume_id for resume_id, _ in self.matcher.ranking(job_id)])
+            self.assertNotIn(("bob", job_id), self.matcher.totals)
+        self.assertFalse(any("bob" in postings["resume"] for postings in self.matcher.postings.values()))
+        self.assertEqual(len(self.matcher.ranking("data")), len(RESUMES) - 1)
+
+    def test_change_log(self):
+        """
+        Test that the change log records rankings that moved.
+        """
+        self.assertEqual(self.matcher.ranking("platform")[0][0], "bob")
+        entries = self.matcher.update_job("platform", job_text="Python engineer. 1+ years of experience.")
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["job_id"], "platform")
+        self.assertIn(entries[0], self.matcher.change_log)
+        self.assertNotEqual(self.matcher.ranking("platform")[0][0], "bob")
+
+    def test_no_change_no_log(self):
+        """
+        Test that a no-op change leaves the change log empty.
+        """
+        self.matcher.change_log = []
+        self.assertEqual(self.matcher.set_skills(list(self.skills)), [])
+        self.assertEqual(self.matcher.change_log, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,14 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import tempfile
+import threading
+import tracemalloc
 import os
-from modules.interview_analyzer.interview_summarize import VideoProcessor
+import shutil
+from modules.interview_analyzer.budget import BudgetExceeded, ResourceBudget
+from modules.interview_analyzer.result_cache import ResultCache, fingerprint_file
+from modules.interview_analyzer.interview_summarize import SUMMARY_DEPENDENCIES, ProcessingCancelled, VideoProcessor
+from tests.test_budget import write_wav
 
 class TestVideoProcessor(unittest.TestCase):
 
@@ -67,17 +73,19 @@ class TestVideoProcessor(unittest.TestCase):
         
         self.assertIn("summarized", summary)  # Check that the summary contains the expected word
 
+    @patch('os.remove')
     @patch.object(VideoProcessor, 'extract_audio')
-    @patch.object(VideoProcessor, 'transcribe_audio')
-    @patch.object(VideoProcessor, 'embed_text')
+    @patch.object(VideoProcessor, 'transcribe_segments')
+    @patch.object(VideoProcessor, 'embed_chunks')
     @patch.object(VideoProcessor, 'generate_summary')
-    def test_process_video(self, mock_generate_summary, mock_embed_text, mock_transcribe_audio, mock_extract_audio):
+    def test_process_video(self, mock_generate_summary, mock_embed_chunks, mock_transcribe_segments, mock_extract_audio,
+                           mock_remove):
         """Test the full video processing pipeline."""
         
         # Mock all the methods used in the process
         mock_extract_audio.return_value = "mock_audio.wav"
-        mock_transcribe_audio.return_value = "This is a mock transcript."
-        mock_embed_text.return_value = [0.1] * 384
+        mock_transcribe_segments.return_value = iter([{"start": 0.0, "end": 2.0, "text": "This is a mock transcript."}])
+        mock_embed_chunks.return_value = [[0.1] * 384]
         mock_generate_summary.return_value = "This is the summary."
         
         processor = VideoProcessor()
@@ -94,5 +102,178 @@ class TestVideoProcessor(unittest.TestCase):
         self.assertEqual(len(processor.faiss_index.ntotal), 1)
         self.assertEqual(len(processor.document_store), 1)
 
+    @patch('os.remove')
+    @patch.object(VideoProcessor, 'extract_audio')
+    @patch.object(VideoProcessor, 'transcribe_segments')
+    @patch.object(VideoProcessor, 'embed_chunks')
+    @patch.object(VideoProcessor, 'generate_summary')
+    def test_stream_video(self, mock_generate_summary, mock_embed_chunks, mock_transcribe_segments, mock_extract_audio,
+                          mock_remove):
+        """Test that results are streamed stage by stage, with chunk summaries as the transcript grows."""
+        mock_extract_audio.return_value = "mock_audio.wav"
+        mock_transcribe_segments.return_value = iter([
+            {"start": 0.0, "end": 30.0, "text": "word " * 200},
+            {"start": 30.0, "end": 60.0, "text": "word " * 200},
+            {"start": 60.0, "end": 70.0, "text": "closing remarks"},
+        ])
+        mock_embed_chunks.side_effect = lambda texts: [[0.1] * 384] * len(texts)
+        mock_generate_summary.side_effect = ["First chunk.", "Second chunk.", "Overall summary."]
+
+        processor = VideoProcessor()
+        events = list(processor.stream_video("mock_video.mp4"))
+        names = [event for event, _ in events]
+
+        self.assertEqual(names, ["segment", "segment", "summary_chunk", "segment", "summary_chunk",
+                                 "summary", "traits", "done"])
+        self.assertEqual(events[5][1], {"summary": "Overall summary."})
+        self.assertEqual(len(events[-1][1]["segments"]), 3)
+
+    @patch.object(VideoProcessor, 'embed_chunks')
+    def test_embed_transcript_in_batches(self, mock_embed_chunks):
+        """Test that the transcript embedding is pooled from chunk embeddings computed a batch at a time."""
+        mock_embed_chunks.side_effect = lambda texts: [[1.0] + [0.0] * 383] * len(texts)
+
+        processor = VideoProcessor(budget=ResourceBudget(embed_batch_size=2))
+        embedding = processor.embed_transcript("word " * (processor.EMBEDDING_CHUNK_WORDS * 5))
+
+        self.assertEqual([len(call.args[0]) for call in mock_embed_chunks.call_args_list], [2, 2, 1])
+        self.assertEqual(len(embedding), 384)
+        self.assertAlmostEqual(float(embedding[0]), 1.0)
+
+    @patch.object(VideoProcessor, 'generate_summary')
+    def test_combine_summaries(self, mock_generate_summary):
+        """Test that chunk summaries are reduced a few at a time until one summary is left."""
+        mock_generate_summary.side_effect = lambda text: "summary"
+
+        processor = VideoProcessor(budget=ResourceBudget(summary_batch_size=3))
+        summary = processor.combine_summaries(["chunk"] * 7)
+
+        self.assertEqual(summary, "summary")
+        self.assertEqual(mock_generate_summary.call_count, 4)  # 7 -> 3 -> 1
+
+    @patch('os.remove')
+    @patch.object(VideoProcessor, 'extract_audio')
+    @patch.object(VideoProcessor, 'transcribe_segments')
+    def test_memory_budget_exceeded(self, mock_transcribe_segments, mock_extract_audio, mock_remove):
+        """Test that going over the memory budget stops processing with a clear error."""
+        mock_extract_audio.return_value = "mock_audio.wav"
+
+        processor = VideoProcessor(budget=ResourceBudget(max_rss_bytes=1))
+        mock_transcribe_segments.side_effect = lambda path: iter([processor.budget.check_memory("transcription")])
+
+        with self.assertRaises(BudgetExceeded) as context:
+            processor.process_video("mock_video.mp4")
+        self.assertIn("memory budget during transcription", str(context.exception))
+        mock_remove.assert_called_once_with("mock_audio.wav")
+
+    @patch('os.remove')
+    @patch.object(VideoProcessor, 'extract_audio')
+    @patch('modules.interview_analyzer.interview_summarize.iter_audio_windows')
+    @patch('speech_recognition.Recognizer.recognize_google')
+    def test_cancelled(self, mock_recognize_google, mock_iter_audio_windows, mock_extract_audio, mock_remove):
+        """Test that setting the cancel event stops processing at the next audio window."""
+        mock_extract_audio.return_value = "mock_audio.wav"
+        mock_iter_audio_windows.return_value = iter([(0.0, 30.0, MagicMock()), (30.0, 60.0, MagicMock())])
+        cancel_event = threading.Event()
+        mock_recognize_google.side_effect = lambda audio_data: cancel_event.set() or "hello"
+
+        processor = VideoProcessor(cancel_event=cancel_event)
+        with self.assertRaises(ProcessingCancelled):
+            processor.process_video("mock_video.mp4")
+        self.assertEqual(mock_recognize_google.call_count, 1)
+        mock_remove.assert_called_once_with("mock_audio.wav")
+
+    @patch('os.remove')
+    @patch.object(VideoProcessor, 'extract_audio')
+    @patch.object(VideoProcessor, 'transcribe_segments')
+    @patch.object(VideoProcessor, 'embed_chunks')
+    @patch.object(VideoProcessor, 'generate_summary')
+    def test_cache_hit_skips_audio_extraction(self, mock_generate_summary, mock_embed_chunks, mock_transcribe_segments,
+                                              mock_extract_audio, mock_remove):
+        """Test that a cached video is looked up by its file and never has its audio extracted again."""
+        mock_extract_audio.return_value = "mock_audio.wav"
+        mock_transcribe_segments.return_value = iter([{"start": 0.0, "end": 2.0, "text": "This is a mock transcript."}])
+        mock_embed_chunks.return_value = [[0.1] * 384]
+        mock_generate_summary.return_value = "This is the summary."
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video_path = os.path.join(temp_dir, "interview.mp4")
+            with open(video_path, 'wb') as video:
+                video.write(b"video bytes")
+            cache = ResultCache(os.path.join(temp_dir, "cache"))
+
+            first = VideoProcessor(cache=cache).process_video(video_path)
+            second = VideoProcessor(cache=cache).process_video(video_path)
+
+        self.assertEqual(second, first)
+        mock_extract_audio.assert_called_once()
+        mock_transcribe_segments.assert_called_once()
+
+    @patch.object(VideoProcessor, 'extract_audio')
+    @patch.object(VideoProcessor, 'embed_chunks')
+    @patch.object(VideoProcessor, 'generate_summary')
+    def test_cached_transcript_summarized_in_chunks(self, mock_generate_summary, mock_embed_chunks, mock_extract_audio):
+        """Test that a cached transcript without a cached summary is summarized chunk by chunk."""
+        mock_embed_chunks.side_effect = lambda texts: [[0.1] * 384] * len(texts)
+        mock_generate_summary.side_effect = lambda text: f"summary of {len(text.split())} words"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video_path = os.path.join(temp_dir, "interview.mp4")
+            with open(video_path, 'wb') as video:
+                video.write(b"video bytes")
+            processor = VideoProcessor(cache=ResultCache(os.path.join(temp_dir, "cache")))
+            transcript = "word " * 800
+            processor._cache_put("transcript", fingerprint_file(video_path), ["transcript"],
+                                 {"transcript": transcript.strip(), "segments": []})
+
+            events = list(processor.stream_video(video_path))
+
+        mock_extract_audio.assert_not_called()
+        chunks = [data["summary"] for event, data in events if event == "summary_chunk"]
+        self.assertEqual(chunks, ["summary of 350 words", "summary of 350 words", "summary of 100 words"])
+        self.assertEqual(mock_generate_summary.call_count, 4)
+
+    def test_chunk_sizes_in_cache_versions(self):
+        """Test that changing a chunk size changes the versions cached summaries and embeddings are keyed on."""
+        processor = VideoProcessor()
+        with patch.object(VideoProcessor, 'SUMMARY_CHUNK_WORDS', 300), \
+                patch.object(VideoProcessor, 'EMBEDDING_CHUNK_WORDS', 100):
+            resized = VideoProcessor()
+
+        self.assertNotEqual(resized._versions(SUMMARY_DEPENDENCIES), processor._versions(SUMMARY_DEPENDENCIES))
+        self.assertNotEqual(resized._versions(["pooling"]), processor._versions(["pooling"]))
+        self.assertEqual(resized._versions(["transcript"]), processor._versions(["transcript"]))
+
+    # A plain function rather than a mock, so recorded calls don't keep every audio window alive
+    @patch('speech_recognition.Recognizer.recognize_google', new=lambda self, audio_data: "word " * 75)
+    @patch.object(VideoProcessor, 'extract_audio')
+    @patch.object(VideoProcessor, 'embed_chunks')
+    @patch.object(VideoProcessor, 'generate_summary')
+    def test_stream_video_peak_memory_is_flat(self, mock_generate_summary, mock_embed_chunks, mock_extract_audio):
+        """Test that streaming a 16 minute interview peaks at about the same memory as a 2 minute one."""
+        mock_embed_chunks.side_effect = lambda texts: [[0.1] * 384] * len(texts)
+        mock_generate_summary.side_effect = lambda text: "A short summary."
+
+        processor = VideoProcessor(budget=ResourceBudget(max_audio_seconds=30))
+        peaks = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join(temp_dir, "source.wav")
+            # stream_video removes the extracted audio, so hand it a fresh copy each time
+            mock_extract_audio.side_effect = lambda video_path: shutil.copy(source_path,
+                                                                            os.path.join(temp_dir, "audio.wav"))
+            for minutes in (2, 16):
+                write_wav(source_path, minutes * 60)
+                tracemalloc.start()
+                try:
+                    events = [event for event, _ in processor.stream_video("interview.mp4")]
+                    peaks.append(tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+                self.assertEqual(events.count("segment"), minutes * 2)
+
+        window_bytes = 30 * 8000 * 2
+        self.assertLess(peaks[1], peaks[0] * 1.2)
+        self.assertLess(peaks[1], 4 * window_bytes)  # The 16 minute file is 32 windows
+
 if __name__ == '__main__':
     unittest.main()
@@ -102,5 +102,16 @@ class TestResumeJobMatcher(unittest.TestCase):
         result = matcher.calculate_experience_match()
         self.assertEqual(result, True)  # No experience requirement means match by default
 
+    def test_numeric_experience_and_certification_ids(self):
+        """
+        Test that numeric years and certification ids are preferred when both sides have them.
+        """
+        resume_data = dict(self.resume_data, experience_years=2.5, certification_ids=['aws-certified-solutions-architect'])
+        job_data = dict(self.job_data, experience_years=3, certification_ids=['aws-certified-solutions-architect'])
+        matcher = ResumeJobMatcher(resume_data, job_data)
+        # The strings say 5+ against 3+, but the parsed spans only cover 2.5 years
+        self.assertFalse(matcher.calculate_experience_match())
+        self.assertEqual(matcher.calculate_certification_match(), 100.0)
+
 if __name__ == '__main__':
     unittest.main()
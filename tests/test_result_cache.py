@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import unittest
+from modules.interview_analyzer.result_cache import ResultCache, fingerprint_file
+
+class TestFingerprintFile(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_fingerprint_follows_content(self):
+        """
+        Test that a file's fingerprint depends on its bytes, not its name.
+        """
+        paths = [os.path.join(self.temp_dir, name) for name in ("a.mp4", "b.mp4", "c.mp4")]
+        for path, content in zip(paths, (b"video" * 500000, b"video" * 500000, b"other" * 500000)):
+            with open(path, 'wb') as file:
+                file.write(content)
+        self.assertEqual(fingerprint_file(paths[0]), fingerprint_file(paths[1]))
+        self.assertNotEqual(fingerprint_file(paths[0]), fingerprint_file(paths[2]))
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.versions = {"transcript": "v1"}
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_put_and_get(self):
+        """
+        Test that a stored result is returned and counted as a hit.
+        """
+        cache = ResultCache(self.cache_dir)
+        self.assertIsNone(cache.get("transcript", "abc", self.versions))
+        cache.put("transcript", "abc", self.versions, {"transcript": "hello"})
+        self.assertEqual(cache.get("transcript", "abc", self.versions), {"transcript": "hello"})
+        self.assertEqual(cache.stats()["stages"]["transcript"], {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_version_change_invalidates_stage(self):
+        """
+        Test that a new model version misses only for the stage that uses it.
+        """
+        cache = ResultCache(self.cache_dir)
+        cache.put("transcript", "abc", {"transcript": "v1"}, "hello")
+        cache.put("summary", "abc", {"transcript": "v1", "summary": "v1"}, "hi")
+        self.assertEqual(cache.get("transcript", "abc", {"transcript": "v1"}), "hello")
+        self.assertIsNone(cache.get("summary", "abc", {"transcript": "v1", "summary": "v2"}))
+
+    def test_persistent(self):
+        """
+        Test that entries survive a new cache instance over the same directory.
+        """
+        ResultCache(self.cache_dir).put("summary", "abc", self.versions, "hi")
+        cache = ResultCache(self.cache_dir)
+        self.assertEqual(cache.get("summary", "abc", self.versions), "hi")
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used entry is evicted once the disk budget is exceeded.
+        """
+        value = "x" * 100
+        cache = ResultCache(self.cache_dir, max_bytes=250)
+        cache.put("transcript", "a", self.versions, value)
+        cache.put("transcript", "b", self.versions, value)
+        cache.get("transcript", "a", self.versions)
+        cache.put("transcript", "c", self.versions, value)
+
+        self.assertEqual(cache.get("transcript", "a", self.versions), value)
+        self.assertIsNone(cache.get("transcript", "b", self.versions))
+        self.assertEqual(cache.get("transcript", "c", self.versions), value)
+        self.assertLessEqual(cache.stats()["bytes"], 250)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
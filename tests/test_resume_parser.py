@@ -41,7 +41,7 @@ class TestResumeParser(unittest.TestCase):
         contact_info = self.parser.extract_contact_information()
         print(contact_info)
         self.assertIn("johndoe@example.com", contact_info["email"])
-        self.assertIn("(123) 456-7890", contact_info["phone"])
+        self.assertIn("1234567890", contact_info["phone"])
 
     def test_summarize(self):
         summary = self.parser.summarize(["Python", "Java", "Cloud Computing", "Team Leadership", "Agile Development", "Machine Learning"])
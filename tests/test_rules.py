@@ -0,0 +1,118 @@
+import datetime
+import unittest
+from modules.job_matching.rules import RuleEngine, total_years
+
+class TestRuleEngine(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up the engine with a sample resume and a fixed reference date.
+        """
+        self.engine = RuleEngine()
+        self.today = datetime.date(2024, 6, 1)
+        self.resume_text = """
+        John Doe
+        Email: JohnDoe@Example.com
+        Phone: (123) 456-7890, +1 555.123.4567
+        Experienced Software Engineer with 7+ years of experience in Python.
+        Senior Engineer, Acme Corp, Jan 2018 - Mar 2021
+        Engineer, Foo Inc, 2015 to 2018
+        Tech Lead, Bar Ltd, June 2021 - Present
+        Certifications: AWS Certified Solutions Architect, PMP.
+        """
+
+    def test_experience(self):
+        """
+        Test that stated experience is converted to a number.
+        """
+        result = self.engine.extract(self.resume_text, self.today)
+        self.assertEqual(result["experience"], [{"text": "7+ years of experience", "years": 7, "minimum": True}])
+
+    def test_date_spans(self):
+        """
+        Test that employment date spans are parsed into months.
+        """
+        spans = self.engine.extract(self.resume_text, self.today)["date_spans"]
+        self.assertEqual([(span["start"], span["end"]) for span in spans], [
+            ((2018, 1), (2021, 3)),
+            ((2015, 1), (2017, 12)),
+            ((2021, 6), (2024, 6)),
+        ])
+        self.assertEqual(spans[0]["months"], 39)
+
+    def test_total_years_counts_overlap_once(self):
+        """
+        Test that overlapping spans are merged before summing.
+        """
+        result = self.engine.extract(self.resume_text, self.today)
+        # Jan 2015 - Mar 2021 (75 months) plus Jun 2021 - Jun 2024 (37 months)
+        self.assertEqual(result["total_years"], 9.3)
+        self.assertEqual(result["experience_years"], 9.3)
+
+    def test_stated_years_win_without_spans(self):
+        """
+        Test that stated years are used when they exceed the date spans.
+        """
+        result = self.engine.extract("Over 12 years of experience.\nEngineer, Acme, 2020 - 2021.", self.today)
+        self.assertEqual(result["total_years"], 1.0)
+        self.assertEqual(result["experience_years"], 12.0)
+
+    def test_year_only_spans(self):
+        """
+        Test that a span without months counts the difference between its years.
+        """
+        spans = self.engine.extract("Engineer, Acme Corp, 2016 - 2020", self.today)["date_spans"]
+        self.assertEqual([span["months"] for span in spans], [48])
+
+    def test_education_spans_ignored(self):
+        """
+        Test that date spans of education entries do not count as experience.
+        """
+        graduate = "Jane Roe\nBachelor's in Computer Science, State University, 2016 - 2020"
+        self.assertEqual(self.engine.extract(graduate, self.today)["experience_years"], 0.0)
+
+        sections = """
+        Experience
+        Acme, Jan 2022 - Present
+        Education
+        State University
+        2016 - 2020
+        Hobbies: chess club 2010 - 2015
+        """
+        result = self.engine.extract(sections, self.today)
+        self.assertEqual([span["start"] for span in result["date_spans"]], [(2022, 1)])
+        self.assertEqual(result["total_years"], 2.5)
+
+    def test_certifications(self):
+        """
+        Test that certifications are extracted with normalized ids.
+        """
+        result = self.engine.extract(self.resume_text, self.today)
+        self.assertEqual([c["text"] for c in result["certifications"]], ["AWS Certified Solutions Architect", "PMP"])
+        self.assertEqual(result["certification_ids"], ["aws-certified-solutions-architect", "pmp"])
+
+    def test_contacts(self):
+        """
+        Test that emails and phone numbers are normalized.
+        """
+        result = self.engine.extract(self.resume_text, self.today)
+        self.assertEqual([e["value"] for e in result["emails"]], ["johndoe@example.com"])
+        self.assertEqual([p["text"] for p in result["phones"]], ["(123) 456-7890", "+1 555.123.4567"])
+        self.assertEqual([p["value"] for p in result["phones"]], ["1234567890", "5551234567"])
+
+    def test_empty_text(self):
+        """
+        Test that text without matches gives empty results.
+        """
+        result = self.engine.extract("", self.today)
+        self.assertEqual(result["experience_years"], 0.0)
+        self.assertEqual(result["certification_ids"], [])
+
+    def test_total_years_empty(self):
+        """
+        Test that no spans add up to zero years.
+        """
+        self.assertEqual(total_years([]), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from modules.serving.runtime import AdmissionController, AdmissionRejected, StageRunner, StageTimeout
+
+class TestAdmissionController(unittest.TestCase):
+
+    def test_admits_up_to_limit(self):
+        """
+        Test that requests are admitted while slots are free.
+        """
+        admission = AdmissionController(max_in_flight=2, max_queued=0, queue_timeout=0.1)
+        admission.acquire()
+        admission.acquire()
+        self.assertEqual(admission.in_flight, 2)
+        admission.release()
+        self.assertEqual(admission.in_flight, 1)
+
+    def test_rejects_when_saturated(self):
+        """
+        Test that a full queue is rejected with 429.
+        """
+        admission = AdmissionController(max_in_flight=1, max_queued=0, queue_timeout=0.1)
+        admission.acquire()
+        with self.assertRaises(AdmissionRejected) as context:
+            admission.acquire()
+        self.assertEqual(context.exception.status_code, 429)
+
+    def test_queue_timeout(self):
+        """
+        Test that a queued request is rejected with 429 if no slot frees up in time.
+        """
+        admission = AdmissionController(max_in_flight=1, max_queued=1, queue_timeout=0.05)
+        admission.acquire()
+        with self.assertRaises(AdmissionRejected) as context:
+            admission.acquire()
+        self.assertEqual(context.exception.status_code, 429)
+        self.assertEqual(admission.queued, 0)
+
+    def test_queued_request_admitted_on_release(self):
+        """
+        Test that a queued request runs once a slot is released.
+        """
+        admission = AdmissionController(max_in_flight=1, max_queued=1, queue_timeout=5)
+        admission.acquire()
+        threading.Timer(0.05, admission.release).start()
+        admission.acquire()
+        self.assertEqual(admission.in_flight, 1)
+
+    def test_drain(self):
+        """
+        Test that draining rejects new requests with 503 and waits for in-flight ones.
+        """
+        admission = AdmissionController(max_in_flight=2, max_queued=0, queue_timeout=0.1)
+        admission.acquire()
+        self.assertFalse(admission.drain(timeout=0.05))
+        with self.assertRaises(AdmissionRejected) as context:
+            admission.acquire()
+        self.assertEqual(context.exception.status_code, 503)
+
+        threading.Timer(0.05, admission.release).start()
+        self.assertTrue(admission.drain(timeout=5))
+
+    def test_release_after(self):
+        """
+        Test that a slot held for abandoned work is freed only when that work finishes.
+        """
+        admission = AdmissionController(max_in_flight=1, max_queued=0, queue_timeout=0.1)
+        admission.acquire()
+        future = Future()
+        admission.release_after(future)
+        self.assertEqual(admission.in_flight, 1)
+        future.set_result(None)
+        self.assertEqual(admission.in_flight, 0)
+
+
+class TestStageRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = StageRunner({"fast": (2, 5), "slow": (1, 0.05)})
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_run(self):
+        """
+        Test that a stage returns its result.
+        """
+        self.assertEqual(self.runner.run("fast", sum, [1, 2, 3]), 6)
+
+    def test_exception_propagates(self):
+        """
+        Test that errors raised by a stage reach the caller.
+        """
+        with self.assertRaises(ZeroDivisionError):
+            self.runner.run("fast", lambda: 1 / 0)
+
+    def test_timeout(self):
+        """
+        Test that a stage running past its time limit raises StageTimeout.
+        """
+        with self.assertRaises(StageTimeout) as context:
+            self.runner.run("slow", time.sleep, 0.5)
+        self.assertEqual(context.exception.stage, "slow")
+
+    def test_timeout_sets_cancel_event(self):
+        """
+        Test that a timeout signals running work to stop and hands back its future.
+        """
+        cancel_event = threading.Event()
+        with self.assertRaises(StageTimeout) as context:
+            self.runner.run("slow", cancel_event.wait, 5, cancel_event=cancel_event)
+        self.assertTrue(cancel_event.is_set())
+        self.assertTrue(context.exception.future.result(timeout=1))
+
+    def test_queue_is_bounded(self):
+        """
+        Test that a stage rejects work with 429 once its workers and queue are full.
+        """
+        runner = StageRunner({"one": (1, 5, 1)})
+        release = threading.Event()
+        futures = [runner.submit("one", release.wait, 5) for _ in range(2)]
+        with self.assertRaises(AdmissionRejected) as context:
+            runner.submit("one", release.wait, 5)
+        self.assertEqual(context.exception.status_code, 429)
+        release.set()
+        runner.shutdown()  # Waits for the queued work, whose slots are freed as it finishes
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertTrue(runner.slots["one"].acquire(blocking=False))
+
+class TestStageStream(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = StageRunner({"stream": (1, 1)})
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_items_in_order(self):
+        """
+        Test that a generator's items arrive in order and its future finishes.
+        """
+        future, items = self.runner.stream("stream", lambda: iter(range(50)), max_buffered=4)
+        self.assertEqual(list(items), list(range(50)))
+        future.result(timeout=1)
+
+    def test_error_propagates(self):
+        """
+        Test that an error raised by the generator reaches the consumer.
+        """
+        def failing():
+            yield 1
+            raise ValueError("bad frame")
+        future, items = self.runner.stream("stream", failing)
+        self.assertEqual(next(items), 1)
+        with self.assertRaises(ValueError):
+            next(items)
+
+    def test_factory_error_propagates(self):
+        """
+        Test that an error raised while creating the generator reaches the consumer without waiting for the deadline.
+        """
+        def load_models():
+            raise RuntimeError("model load failed")
+        runner = StageRunner({"stream": (1, 5)})
+        future, items = runner.stream("stream", load_models)
+        started = time.monotonic()
+        with self.assertRaises(RuntimeError) as context:
+            next(items)
+        self.assertEqual(str(context.exception), "model load failed")
+        self.assertLess(time.monotonic() - started, 1)
+        future.result(timeout=1)
+        runner.shutdown()
+
+    def test_timeout_cancels_producer(self):
+        """
+        Test that the stage time limit covers the whole stream and cancels the producer.
+        """
+        cancel_event = threading.Event()
+        def slow():
+            while not cancel_event.wait(0.01):
+                yield "tick"
+        runner = StageRunner({"stream": (1, 0.1)})
+        future, items = runner.stream("stream", slow, cancel_event=cancel_event)
+        with self.assertRaises(StageTimeout) as context:
+            for _ in items:
+                pass
+        self.assertTrue(cancel_event.is_set())
+        context.exception.future.result(timeout=2)
+        runner.shutdown()
+
+    def test_abandoned_stream_stops_producer(self):
+        """
+        Test that closing the consumer early stops a producer blocked on the full queue.
+        """
+        produced = []
+        def endless():
+            while True:
+                produced.append(len(produced))
+                yield produced[-1]
+        future, items = self.runner.stream("stream", endless, max_buffered=2)
+        self.assertEqual(next(items), 0)
+        items.close()
+        future.result(timeout=2)
+        self.assertLess(len(produced), 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+from modules.job_matching.sharding import ResumeShard, ShardedMatcher
+
+SKILLS = ["Python", "Machine Learning", "SQL", "Deep Learning", "Java", "Docker"]
+
+def make_resumes(count, dim=8, seed=0):
+    generator = random.Random(seed)
+    resumes = []
+    for i in range(count):
+        resume_data = {
+            "skills": generator.sample(SKILLS, generator.randint(0, len(SKILLS))),
+            "education": generator.choice([["bachelor's"], ["master's"], []]),
+            "certifications": [],
+            "experience": [f"{generator.randint(0, 10)}+ years of experience"],
+        }
+        embedding = [generator.uniform(-1, 1) for _ in range(dim)]
+        resumes.append((f"resume-{i}", resume_data, embedding))
+    return resumes
+
+class TestShardedMatcher(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.resumes = make_resumes(60)
+        cls.job_data = {
+            "skills": ["Python", "SQL", "Docker"],
+            "education": ["master's"],
+            "certifications": [],
+            "experience": ["3+ years of experience"],
+        }
+        cls.job_embedding = [0.5] * 8
+        cls.matcher = ShardedMatcher(num_shards=3)
+        cls.matcher.add_resumes(cls.resumes)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.matcher.close()
+
+    def test_partitions_every_resume(self):
+        """
+        Test that every resume is stored in exactly one shard.
+        """
+        self.assertEqual(len(self.matcher), len(self.resumes))
+
+    def test_query_matches_single_shard(self):
+        """
+        Test that the merged top-K scores equal a single unsharded ranking.
+        """
+        shard = ResumeShard()
+        shard.add(self.resumes)
+        expected = shard.query(self.job_data, self.job_embedding, top_k=10)
+        results = self.matcher.query(self.job_data, self.job_embedding, top_k=10)
+        self.assertEqual(len(results), 10)
+        for result, expected_result in zip(results, expected):
+            self.assertAlmostEqual(result["score"], expected_result["score"], places=4)
+
+    def test_query_without_embedding(self):
+        """
+        Test that without a job embedding the score is the structured match score.
+        """
+        results = self.matcher.query(self.job_data, top_k=5)
+        for result in results:
+            self.assertEqual(result["score"], result["match"]["total_match_score"])
+
+    def test_scores_sorted(self):
+        """
+        Test that results are returned best first.
+        """
+        scores = [result["score"] for result in self.matcher.query(self.job_data, self.job_embedding, top_k=20)]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_shard_error_keeps_pipes_in_step(self):
+        """
+        Test that a query failing on every shard leaves the matcher usable for the next one.
+        """
+        with self.assertRaises(RuntimeError):
+            self.matcher.query({"skills": 5}, top_k=5)
+        self.assertEqual(len(self.matcher.query(self.job_data, top_k=5)), 5)
+        self.assertEqual(len(self.matcher), len(self.resumes))
+
+if __name__ == '__main__':
+    unittest.main()
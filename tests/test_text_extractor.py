@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from docx import Document
+from modules.job_matching.text_extractor import extract_text_from_docx, extract_text_from_file, iter_docx_text
+
+TEXT_BOX_PARAGRAPH = """
+<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+     xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
+  <w:r><w:t>Before box</w:t></w:r>
+  <w:r>
+    <mc:AlternateContent>
+      <mc:Choice Requires="wps">
+        <w:drawing><w:txbxContent><w:p><w:r><w:t>Certified Kubernetes Administrator</w:t></w:r></w:p></w:txbxContent></w:drawing>
+      </mc:Choice>
+      <mc:Fallback>
+        <w:pict><w:txbxContent><w:p><w:r><w:t>Certified Kubernetes Administrator</w:t></w:r></w:p></w:txbxContent></w:pict>
+      </mc:Fallback>
+    </mc:AlternateContent>
+  </w:r>
+</w:p>
+"""
+
+class TestDocxExtraction(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def save(self, document, name="resume.docx"):
+        path = os.path.join(self.temp_dir, name)
+        document.save(path)
+        return path
+
+    def test_parity_with_python_docx(self):
+        """
+        Test that plain paragraphs come out exactly as python-docx reports them.
+        """
+        document = Document()
+        document.add_paragraph("John Doe")
+        paragraph = document.add_paragraph("Skills:\tPython, SQL")
+        paragraph.add_run().add_break()
+        paragraph.add_run("Machine Learning")
+        document.add_paragraph("")
+        document.add_paragraph("7+ years of experience")
+        path = self.save(document)
+
+        expected = '\n'.join(p.text for p in Document(path).paragraphs)
+        self.assertEqual(extract_text_from_docx(path), expected)
+        self.assertEqual(extract_text_from_file(path), expected)
+
+    def test_tables(self):
+        """
+        Test that table cells are extracted in reading order.
+        """
+        document = Document()
+        document.add_paragraph("Certifications")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "AWS Certified Solutions Architect"
+        table.cell(0, 1).text = "2021"
+        table.cell(1, 0).text = "PMP"
+        table.cell(1, 1).text = "2019"
+        document.add_paragraph("References available on request")
+
+        paragraphs = [p for p in iter_docx_text(self.save(document)) if p]
+        self.assertEqual(paragraphs, [
+            "Certifications", "AWS Certified Solutions Architect", "2021", "PMP", "2019",
+            "References available on request",
+        ])
+
+    def test_headers_and_footers(self):
+        """
+        Test that headers come before the body and footers after it.
+        """
+        document = Document()
+        document.sections[0].header.paragraphs[0].text = "Jane Smith - jane@example.com"
+        document.sections[0].footer.paragraphs[0].text = "Page footer"
+        document.add_paragraph("Body text")
+
+        paragraphs = [p for p in iter_docx_text(self.save(document)) if p]
+        self.assertEqual(paragraphs, ["Jane Smith - jane@example.com", "Body text", "Page footer"])
+
+    def test_text_boxes(self):
+        """
+        Test that text box content is extracted once, after the paragraph anchoring it, ignoring the
+        compatibility fallback.
+        """
+        path = self.save(Document())
+        with zipfile.ZipFile(path) as archive:
+            parts = {name: archive.read(name) for name in archive.namelist()}
+        parts['word/document.xml'] = parts['word/document.xml'].replace(
+            b'<w:sectPr', TEXT_BOX_PARAGRAPH.encode('utf-8') + b'<w:sectPr', 1
+        )
+        with zipfile.ZipFile(path, 'w') as archive:
+            for name, data in parts.items():
+                archive.writestr(name, data)
+
+        paragraphs = [p for p in iter_docx_text(path) if p]
+        self.assertEqual(paragraphs, ["Before box", "Certified Kubernetes Administrator"])
+
+if __name__ == '__main__':
+    unittest.main()